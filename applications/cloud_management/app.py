@@ -1,15 +1,30 @@
 import argparse
+import sys
+import time
 
-from textual.app import App, CSSPathType
-from textual.driver import Driver
+# Taken before Textual and the services are imported, so the startup trace includes loading them.
+STARTED_AT = time.perf_counter()
 
-from .models import ServicePath
-from .screens import MainScreen, StandaloneScreen
+from textual import work  # noqa: E402
+from textual.app import App, CSSPathType  # noqa: E402
+from textual.binding import Binding  # noqa: E402
+from textual.driver import Driver  # noqa: E402
+
+from .models import ServicePath  # noqa: E402
+from .services import (  # noqa: E402
+    StackExporter,
+    StartupTrace,
+    UIProfiler,
+    call_metrics,
+    client_pool,
+    region_catalogue,
+)
 
 
 class CloudManagementConsole(App):
     CSS_PATH = "app.tcss"
     TITLE = "Cloud Management In Terminal"
+    BINDINGS = [Binding("f2", "toggle_metrics", "AWS Calls", show=True)]
 
     def __init__(
         self,
@@ -17,29 +32,165 @@ class CloudManagementConsole(App):
         driver_class: type[Driver] | None = None,
         css_path: CSSPathType | None = None,
         watch_css: bool = False,
+        startup_trace: StartupTrace | None = None,
+        max_mounted_pages: int | None = None,
+        max_memory_mb: int | None = None,
     ):
         super().__init__(driver_class, css_path, watch_css)
         self._initial_service_path = initial_service_path
+        self._startup_trace = startup_trace
+        self._max_mounted_pages = max_mounted_pages
+        self._max_memory_mb = max_memory_mb
+
+    async def on_mount(self) -> None:
+        # Screens pull in every page and component, so they are imported here rather than at module level.
+        from .screens import MainScreen, StandaloneScreen
 
-    def on_mount(self) -> None:
+        self.mark_startup("import")
         if self._initial_service_path.completed:
-            self.push_screen(StandaloneScreen(self._initial_service_path))
+            await self.push_screen(StandaloneScreen(self._initial_service_path))
         else:
-            self.push_screen(MainScreen())
+            await self.push_screen(
+                MainScreen(
+                    max_mounted_pages=self._max_mounted_pages or MainScreen.DEFAULT_MAX_MOUNTED_PAGES,
+                    max_memory_mb=self._max_memory_mb or MainScreen.DEFAULT_MAX_MEMORY_MB,
+                )
+            )
+        self.mark_startup("compose")
+        self.call_after_refresh(self.handle_first_paint)
+
+    def handle_first_paint(self) -> None:
+        self.mark_startup("first paint")
+        # The SDK is loaded only once the first frame is on screen, while the user is still picking a profile.
+        self.preload_sdk()
 
+    @work(thread=True, group="preload-sdk")
+    def preload_sdk(self) -> None:
+        client_pool.preload()
+        self.mark_startup("sdk loaded")
 
-def parse_arguments() -> ServicePath:
+    def action_toggle_metrics(self) -> None:
+        from .screens import MetricsScreen
+
+        if isinstance(self.screen, MetricsScreen):
+            self.pop_screen()
+        else:
+            self.push_screen(MetricsScreen())
+
+    def mark_startup(self, name: str) -> None:
+        if self._startup_trace is not None:
+            self._startup_trace.mark(name)
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(prog="CloudInTerm", description="Cloud management in terminal")
     parser.add_argument("-p", "--profile", help="profile name", default=None)
     parser.add_argument("-r", "--region", help="region name", default=None)
     parser.add_argument("-s", "--service", help="service name", default=None)
-    args = parser.parse_args()
-    return ServicePath(profile_name=args.profile, region_name=args.region, service_name=args.service)
+    parser.add_argument(
+        "--startup-trace", help="print time spent importing, composing and until first paint", action="store_true"
+    )
+    parser.add_argument("--max-tabs", help="service tabs kept in memory before suspending the oldest", type=int)
+    parser.add_argument("--max-memory-mb", help="memory use above which inactive service tabs are suspended", type=int)
+    parser.add_argument(
+        "--metrics-file", help="write per-operation AWS call metrics to this file as JSON lines on exit"
+    )
+    parser.add_argument(
+        "--profile-ui",
+        help="time message handlers, compose, renders and workers, and write a report to FILE or stderr on exit",
+        nargs="?",
+        const="-",
+        metavar="FILE",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+    export_parser = subparsers.add_parser(
+        "export", help="write stacks, parameters, outputs and resources as JSON lines, without the UI"
+    )
+    export_parser.add_argument(
+        "--profiles", help="profile names, all configured profiles by default", nargs="+", metavar="PROFILE"
+    )
+    export_parser.add_argument(
+        "--regions", help="region names, all known regions by default", nargs="+", metavar="REGION"
+    )
+    export_parser.add_argument(
+        "--records",
+        help="record types to write, all by default",
+        nargs="+",
+        choices=StackExporter.RECORD_TYPES,
+        default=list(StackExporter.RECORD_TYPES),
+    )
+    export_parser.add_argument("-o", "--output", help="output file, stdout by default", default="-")
+    export_parser.add_argument("--max-workers", help="concurrent requests", type=int, default=StackExporter.MAX_WORKERS)
+    return parser.parse_args(argv)
+
+
+def export(args: argparse.Namespace) -> int:
+    profiles = args.profiles or client_pool.available_profiles()
+    regions = args.regions or region_catalogue.region_names()
+    service_paths = [
+        ServicePath(profile_name=profile, region_name=region, service_name="cloudformation")
+        for profile in profiles
+        for region in regions
+    ]
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        exporter = StackExporter(output, record_types=args.records, max_workers=args.max_workers)
+        exporter.export(service_paths)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    print(
+        f"Exported {exporter.stacks} stacks as {exporter.records} records from {len(service_paths)} "
+        f"profile/region pairs ({exporter.skipped} skipped for rejected credentials or regions not enabled), "
+        f"{exporter.errors} errors.",
+        file=sys.stderr,
+    )
+    return 1 if exporter.errors else 0
+
+
+def write_metrics(path: str) -> None:
+    with open(path, "w", encoding="utf-8") as output:
+        call_metrics.write_jsonl(output)
+
+
+def write_ui_profile(ui_profiler: UIProfiler, path: str) -> None:
+    if path == "-":
+        print(ui_profiler.report(), file=sys.stderr)
+        return
+    with open(path, "w", encoding="utf-8") as output:
+        output.write(ui_profiler.report() + "\n")
+
+
+def create_app(args: argparse.Namespace, startup_trace: StartupTrace | None = None) -> CloudManagementConsole:
+    service_path = ServicePath(profile_name=args.profile, region_name=args.region, service_name=args.service)
+    return CloudManagementConsole(
+        service_path,
+        startup_trace=startup_trace,
+        max_mounted_pages=args.max_tabs,
+        max_memory_mb=args.max_memory_mb,
+    )
 
 
 def main():
-    app = CloudManagementConsole(parse_arguments())
+    startup_trace = StartupTrace(started_at=STARTED_AT)
+    args = parse_arguments()
+    if args.command == "export":
+        exit_code = export(args)
+        if args.metrics_file:
+            write_metrics(args.metrics_file)
+        sys.exit(exit_code)
+    ui_profiler = UIProfiler()
+    if args.profile_ui:
+        ui_profiler.install()
+    app = create_app(args, startup_trace if args.startup_trace else None)
     app.run()
+    if args.metrics_file:
+        write_metrics(args.metrics_file)
+    if args.profile_ui:
+        write_ui_profile(ui_profiler, args.profile_ui)
+    if args.startup_trace:
+        print(startup_trace.report(), file=sys.stderr)
 
 
 if __name__ == "__main__":
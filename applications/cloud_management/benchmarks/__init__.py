@@ -0,0 +1,4 @@
+from .fake_aws import FakeAWS
+from .suite import main, run_benchmarks
+
+__all__ = ["FakeAWS", "main", "run_benchmarks"]
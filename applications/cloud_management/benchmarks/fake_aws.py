@@ -0,0 +1,139 @@
+import datetime
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+
+PARAMS_CONTEXT_KEY = "fake_aws_params"
+
+
+class FakeAWS:
+    """Answers AWS calls from generated data instead of the network.
+
+    Responses are injected through the same `before-call` hook that botocore's `Stubber` uses, but they are looked
+    up by operation rather than queued in order, so concurrent workers can call in any order.
+    """
+
+    def __init__(
+        self,
+        stack_count: int = 500,
+        page_size: int = 100,
+        resource_count: int = 200,
+        event_count: int = 100,
+        latency: float = 0.02,
+    ) -> None:
+        self.stack_count = stack_count
+        self.page_size = page_size
+        self.resource_count = resource_count
+        self.event_count = event_count
+        self.latency = latency
+        self.calls: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._handlers: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+            "ListStacks": self.list_stacks,
+            "DescribeStacks": self.describe_stacks,
+            "ListStackResources": self.list_stack_resources,
+            "DescribeStackEvents": self.describe_stack_events,
+            "GetTemplate": self.get_template,
+            "GetCallerIdentity": self.get_caller_identity,
+        }
+
+    def attach(self, client: "BaseClient") -> None:
+        client.meta.events.register("before-parameter-build", self._remember_params)
+        client.meta.events.register("before-call", self._respond)
+
+    def _remember_params(self, params: dict[str, Any], context: dict[str, Any], **kwargs) -> None:
+        context[PARAMS_CONTEXT_KEY] = dict(params)
+
+    def _respond(self, model: Any, context: dict[str, Any], **kwargs) -> tuple[Any, dict[str, Any]]:
+        from botocore.awsrequest import AWSResponse
+
+        with self._lock:
+            self.calls[model.name] = self.calls.get(model.name, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+        handler = self._handlers.get(model.name)
+        parsed = handler(context.get(PARAMS_CONTEXT_KEY, {})) if handler else {}
+        parsed.setdefault("ResponseMetadata", {"HTTPStatusCode": 200, "RetryAttempts": 0})
+        return AWSResponse("https://fake-aws.invalid", 200, {}, None), parsed
+
+    def stack_id(self, index: int) -> str:
+        return f"arn:aws:cloudformation:us-east-1:123456789012:stack/bench-stack-{index}/{index:08d}"
+
+    def list_stacks(self, params: dict[str, Any]) -> dict[str, Any]:
+        start = int(params.get("NextToken") or 0)
+        end = min(start + self.page_size, self.stack_count)
+        summaries = [
+            {
+                "StackName": f"bench-stack-{index}",
+                "StackId": self.stack_id(index),
+                "StackStatus": "UPDATE_IN_PROGRESS" if index % 50 == 0 else "CREATE_COMPLETE",
+                "CreationTime": datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc),
+            }
+            for index in range(start, end)
+        ]
+        response: dict[str, Any] = {"StackSummaries": summaries}
+        if end < self.stack_count:
+            response["NextToken"] = str(end)
+        return response
+
+    def describe_stacks(self, params: dict[str, Any]) -> dict[str, Any]:
+        stack_id = params.get("StackName", "")
+        return {
+            "Stacks": [
+                {
+                    "StackName": stack_id.split("/")[1] if "/" in stack_id else stack_id,
+                    "StackId": stack_id,
+                    "StackStatus": "CREATE_COMPLETE",
+                    "CreationTime": datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc),
+                    "Parameters": [{"ParameterKey": f"Param{i}", "ParameterValue": f"value-{i}"} for i in range(20)],
+                    "Outputs": [{"OutputKey": f"Output{i}", "OutputValue": f"value-{i}"} for i in range(20)],
+                    "Tags": [{"Key": f"tag-{i}", "Value": f"value-{i}"} for i in range(10)],
+                }
+            ]
+        }
+
+    def list_stack_resources(self, params: dict[str, Any]) -> dict[str, Any]:
+        start = int(params.get("NextToken") or 0)
+        end = min(start + self.page_size, self.resource_count)
+        response: dict[str, Any] = {
+            "StackResourceSummaries": [
+                {
+                    "LogicalResourceId": f"Resource{i}",
+                    "PhysicalResourceId": f"physical-resource-{i}",
+                    "ResourceType": "AWS::S3::Bucket",
+                    "ResourceStatus": "CREATE_COMPLETE",
+                    "LastUpdatedTimestamp": datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc),
+                }
+                for i in range(start, end)
+            ]
+        }
+        if end < self.resource_count:
+            response["NextToken"] = str(end)
+        return response
+
+    def describe_stack_events(self, params: dict[str, Any]) -> dict[str, Any]:
+        stack_id = params.get("StackName", "")
+        return {
+            "StackEvents": [
+                {
+                    "EventId": f"event-{i}",
+                    "StackId": stack_id,
+                    "StackName": stack_id,
+                    "LogicalResourceId": f"Resource{i}",
+                    "ResourceStatus": "CREATE_COMPLETE",
+                    "Timestamp": datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+                    - datetime.timedelta(seconds=i),
+                }
+                for i in range(self.event_count)
+            ]
+        }
+
+    def get_template(self, params: dict[str, Any]) -> dict[str, Any]:
+        resources = "".join(f"  Resource{i}:\n    Type: AWS::S3::Bucket\n" for i in range(self.resource_count))
+        return {"TemplateBody": f"Resources:\n{resources}"}
+
+    def get_caller_identity(self, params: dict[str, Any]) -> dict[str, Any]:
+        return {"UserId": "AIDAFAKE", "Account": "123456789012", "Arn": "arn:aws:iam::123456789012:user/bench"}
@@ -0,0 +1,202 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Callable
+
+from textual.widgets import Input
+
+from .. import app as app_module
+from ..app import CloudManagementConsole
+from ..components import SearchableList, StackList
+from ..models import ServicePath
+from ..services import StartupTrace, client_pool, stack_details_cache
+from .fake_aws import FakeAWS
+
+SCREEN_SIZE = (160, 50)
+
+
+def prepare_environment(directory: Path, profile_count: int) -> None:
+    config = "".join(f"[profile bench-{i}]\nregion = us-east-1\n\n" for i in range(profile_count))
+    credentials = "".join(
+        f"[bench-{i}]\naws_access_key_id = AKIAFAKE\naws_secret_access_key = fake\n\n" for i in range(profile_count)
+    )
+    (directory / "config").write_text(config)
+    (directory / "credentials").write_text(credentials)
+    os.environ["AWS_CONFIG_FILE"] = str(directory / "config")
+    os.environ["AWS_SHARED_CREDENTIALS_FILE"] = str(directory / "credentials")
+    os.environ["AWS_EC2_METADATA_DISABLED"] = "true"
+    os.environ["XDG_CACHE_HOME"] = str(directory / "cache")
+
+
+async def wait_until(predicate: Callable[[], bool], timeout: float = 30.0) -> None:
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("Benchmark condition was not reached in time")
+        await asyncio.sleep(0.001)
+
+
+def check_command_line() -> None:
+    """Parse the command lines the terminal is launched with, so options `main` reads can't go missing unnoticed."""
+    for argv, profile_ui in [([], None), (["--profile-ui"], "-"), (["--profile-ui", "profile.txt"], "profile.txt")]:
+        args = app_module.parse_arguments(argv)
+        if args.profile_ui != profile_ui or args.command is not None:
+            raise AssertionError(f"Unexpected arguments parsed from {argv}: {args}")
+
+
+async def bench_main_screen() -> dict[str, float]:
+    startup_trace = StartupTrace()
+    # Built the way `main` builds it when launched without arguments.
+    app = app_module.create_app(app_module.parse_arguments([]), startup_trace)
+    async with app.run_test(size=SCREEN_SIZE):
+        await wait_until(lambda: startup_trace.elapsed("first paint") is not None)
+        lists = list(app.screen.query(SearchableList))
+        await wait_until(lambda: all(searchable_list.items for searchable_list in lists))
+        lists_filled = time.perf_counter() - startup_trace.started_at
+    return {
+        "main_first_paint": startup_trace.elapsed("first paint") or 0.0,
+        "main_lists_filled": lists_filled,
+    }
+
+
+async def bench_filter_keystrokes(query: str) -> list[float]:
+    samples = []
+    app = CloudManagementConsole(ServicePath())
+    async with app.run_test(size=SCREEN_SIZE):
+        profile_list = app.screen.query_one("#profile-list", SearchableList)
+        await wait_until(lambda: bool(profile_list.items))
+        search_input = profile_list.query_one(Input)
+        search_input.focus()
+        for key in query:
+            started_at = time.perf_counter()
+            search_input.insert_text_at_cursor(key)
+            expected_query = search_input.value.lower().strip()
+            await wait_until(lambda: profile_list.filter_query == expected_query)
+            samples.append(time.perf_counter() - started_at)
+    return samples
+
+
+async def bench_stack_selection(fake_aws: FakeAWS, selections: int) -> dict[str, Any]:
+    from ..pages import CloudFormation
+
+    samples = []
+    service_path = ServicePath(profile_name="bench-0", region_name="us-east-1", service_name="cloudformation")
+    app = CloudManagementConsole(service_path)
+    started_at = time.perf_counter()
+    async with app.run_test(size=SCREEN_SIZE):
+        await wait_until(lambda: bool(app.screen.query(CloudFormation)))
+        page = app.screen.query_one(CloudFormation)
+        stack_list = page.query_one(StackList)
+        await wait_until(lambda: len(stack_list) > 0)
+        first_rows = time.perf_counter() - started_at
+        await wait_until(lambda: len(stack_list) == fake_aws.stack_count)
+        all_rows = time.perf_counter() - started_at
+
+        for selection in range(selections):
+            index = (selection * 7 + 1) % fake_aws.stack_count
+            stack = stack_list.get_stack(index)
+            stack_details_cache.clear()
+            started_at = time.perf_counter()
+            stack_list.jump_to(index)
+            stack_list.action_select()
+            await wait_until(lambda: stack_details_populated(page, stack.stack_name, fake_aws))
+            samples.append(time.perf_counter() - started_at)
+    return {"stack_list_first_rows": first_rows, "stack_list_all_rows": all_rows, "stack_selection": samples}
+
+
+def stack_details_populated(page: Any, stack_name: str, fake_aws: FakeAWS) -> bool:
+    properties_table = page.properties_table
+    if properties_table.row_count == 0 or properties_table.get_row_at(0)[1] != stack_name:
+        return False
+    return (
+        page.resources_table.row_count == fake_aws.resource_count
+        and page.events_view.row_count == fake_aws.event_count
+        and page.template_view.line_count > 0
+    )
+
+
+def summarize(samples: list[float]) -> dict[str, Any]:
+    milliseconds = sorted(sample * 1000 for sample in samples)
+    return {
+        "unit": "ms",
+        "samples": [round(sample, 3) for sample in milliseconds],
+        "min": round(milliseconds[0], 3),
+        "median": round(statistics.median(milliseconds), 3),
+        "p95": round(milliseconds[min(len(milliseconds) - 1, int(len(milliseconds) * 0.95))], 3),
+        "max": round(milliseconds[-1], 3),
+    }
+
+
+def package_version(name: str) -> str | None:
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return None
+
+
+async def run_benchmarks(args: argparse.Namespace) -> dict[str, Any]:
+    fake_aws = FakeAWS(
+        stack_count=args.stacks, resource_count=args.resources, event_count=args.events, latency=args.latency
+    )
+    check_command_line()
+    client_pool.clear()
+    client_pool.add_client_hook(fake_aws.attach)
+    samples: dict[str, list[float]] = {}
+
+    def record(name: str, values: float | list[float]) -> None:
+        samples.setdefault(name, []).extend(values if isinstance(values, list) else [values])
+
+    for _ in range(args.repeat):
+        for name, value in (await bench_main_screen()).items():
+            record(name, value)
+        record("filter_keystroke", await bench_filter_keystrokes(args.query))
+        for name, value in (await bench_stack_selection(fake_aws, args.selections)).items():
+            record(name, value)
+
+    return {
+        "benchmark": "cloud-management-ui",
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "textual": package_version("textual"),
+            "boto3": package_version("boto3"),
+        },
+        "parameters": {key: value for key, value in vars(args).items() if key != "output"},
+        "aws_calls": fake_aws.calls,
+        "results": {name: summarize(values) for name, values in samples.items()},
+    }
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="CloudInTermBench", description="Headless UI benchmarks")
+    parser.add_argument("-o", "--output", help="write JSON results to this file instead of stdout", default=None)
+    parser.add_argument("--repeat", help="number of times to run every scenario", type=int, default=3)
+    parser.add_argument("--profiles", help="number of fake profiles", type=int, default=300)
+    parser.add_argument("--stacks", help="number of fake stacks", type=int, default=2000)
+    parser.add_argument("--resources", help="number of resources per stack", type=int, default=500)
+    parser.add_argument("--events", help="number of events per stack", type=int, default=100)
+    parser.add_argument("--selections", help="stack selections per run", type=int, default=5)
+    parser.add_argument("--latency", help="simulated AWS latency in seconds", type=float, default=0.02)
+    parser.add_argument("--query", help="text typed into the profile search", default="bench-12")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_arguments()
+    with tempfile.TemporaryDirectory(prefix="cloud-management-bench-") as directory:
+        prepare_environment(Path(directory), args.profiles)
+        results = asyncio.run(run_benchmarks(args))
+    output = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        sys.stdout.write(output + "\n")
@@ -1,3 +1,4 @@
+from .entity import EntityCommands
 from .region import RegionCommands
 
-__all__ = ["RegionCommands"]
+__all__ = ["EntityCommands", "RegionCommands"]
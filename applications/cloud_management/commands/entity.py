@@ -0,0 +1,36 @@
+from functools import partial
+
+from textual.command import Hit, Hits, Provider
+from textual.message import Message
+
+from ..models import Entity
+from ..services import entity_index
+
+
+class EntityCommands(Provider):
+    """Finds any stack, resource or output loaded so far, in any tab, and jumps to it."""
+
+    MAX_HITS = 20
+
+    class Selected(Message):
+        def __init__(self, entity: Entity) -> None:
+            self.entity = entity
+            super().__init__()
+
+    async def search(self, query: str) -> Hits:
+        matcher = self.matcher(query)
+        for score, entity in entity_index.search(query, limit=self.MAX_HITS):
+            location = f"{entity.service_path.profile_name} / {entity.service_path.region_name}"
+            description = f"{entity.kind} in {entity.stack_name} ({location})" if entity.kind != "stack" else location
+            if entity.aliases and entity.aliases[0]:
+                description = f"{description}: {entity.aliases[0]}"
+            yield Hit(
+                score,
+                matcher.highlight(entity.name),
+                partial(self.select_entity, entity),
+                text=entity.name,
+                help=description,
+            )
+
+    def select_entity(self, entity: Entity) -> None:
+        self.screen.post_message(self.Selected(entity))
@@ -1,39 +1,46 @@
 from functools import partial
 
-import boto3
 from textual.command import Hit, Hits, Provider
 from textual.message import Message
 
+from ..models import Region, SearchIndex
+from ..models.search_index import tokenize
+from ..services import region_catalogue
+
 
 class RegionCommands(Provider):
+    """Switches the region picked on the welcome page, searching the region catalogue's pre-built index."""
+
+    MAX_HITS = 10
+
     class Selected(Message):
         def __init__(self, region_name: str) -> None:
             self.region_name = region_name
             super().__init__()
 
-    def get_available_regions(self) -> list[str]:
-        return boto3.Session().get_available_regions("s3")
-
     async def startup(self) -> None:
-        worker = self.app.run_worker(self.get_available_regions, thread=True)
-        self._regions = await worker.wait()
+        # The catalogue and its index are built once per process; only the first palette may wait for the disk cache.
+        worker = self.app.run_worker(region_catalogue.search_index, thread=True)
+        self._search_index: SearchIndex[Region] = await worker.wait()
 
     async def search(self, query: str) -> Hits:
-        matcher = self.matcher(query)
-        max_match = 5
-        for region in self._regions:
-            command = f"region {region}"
-            score = matcher.match(command)
-            if score > 0:
-                yield Hit(
-                    score,
-                    matcher.highlight(command),
-                    partial(self.select_region, region),
-                    help=f"Change AWS region to {region}",
-                )
-                max_match -= 1
-            if max_match <= 0:
-                break
+        tokens = tokenize(query)
+        if tokens and "region".startswith(tokens[0]):
+            tokens = tokens[1:]
+        if not tokens:
+            return
+        matcher = self.matcher(" ".join(tokens))
+        positions = self._search_index.search(" ".join(tokens))
+        for position in positions[: self.MAX_HITS]:
+            region = self._search_index.value(position)
+            command = f"region {region.title}"
+            yield Hit(
+                self._search_index.normalized_score(position, tokens),
+                matcher.highlight(command),
+                partial(self.select_region, region.region_name),
+                text=command,
+                help=f"Change AWS region to {region.region_name}",
+            )
 
     def select_region(self, region_name: str) -> None:
         self.screen.post_message(self.Selected(region_name))
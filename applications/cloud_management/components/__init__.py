@@ -1,7 +1,21 @@
 from .footer import Footer
+from .json_tree import JsonTree
 from .logo import Logo
 from .profile_list import ProfileList
 from .searchable_list import SearchableList
 from .service_list import ServiceList
+from .stack_events import StackEvents
+from .stack_list import StackList
+from .template_view import TemplateView
 
-__all__ = ["ProfileList", "Footer", "Logo", "ServiceList", "SearchableList"]
+__all__ = [
+    "ProfileList",
+    "Footer",
+    "JsonTree",
+    "Logo",
+    "ServiceList",
+    "SearchableList",
+    "StackEvents",
+    "StackList",
+    "TemplateView",
+]
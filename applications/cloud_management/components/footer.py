@@ -1,10 +1,23 @@
-import boto3
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+
 from rich.text import Text
 from textual.app import ComposeResult, RenderResult
 from textual.reactive import reactive
 from textual.widget import Widget
 from textual.widgets import Static
 
+from ..services import call_metrics
+
+
+@cache
+def sdk_version() -> str:
+    # Read from the package metadata so the footer doesn't import boto3 before the first paint.
+    try:
+        return version("boto3")
+    except PackageNotFoundError:
+        return "unknown"
+
 
 class FooterSession(Static):
     profile_name: reactive[str] = reactive("")
@@ -30,8 +43,28 @@ class FooterInfo(Widget):
         }
     """
 
+    REFRESH_SECONDS = 1
+
+    def on_mount(self) -> None:
+        self._metrics_version = call_metrics.version
+        self.set_interval(self.REFRESH_SECONDS, self.refresh_metrics)
+
+    def refresh_metrics(self) -> None:
+        if call_metrics.version != self._metrics_version:
+            self._metrics_version = call_metrics.version
+            self.refresh()
+
     def render(self) -> RenderResult:
-        return Text(f"SDK: v{boto3.__version__}", no_wrap=True, overflow="ellipsis")
+        summary = call_metrics.summary()
+        parts = [f"SDK: v{sdk_version()}"]
+        if summary["calls"]:
+            calls = f"calls: {summary['calls']}  p95: {summary['p95_ms']:.0f}ms"
+            if summary["throttles"]:
+                calls += f"  throttled: {summary['throttles']}"
+            if summary["errors"]:
+                calls += f"  errors: {summary['errors']}"
+            parts.insert(0, calls)
+        return Text("  ".join(parts), no_wrap=True, overflow="ellipsis")
 
 
 class Footer(Widget):
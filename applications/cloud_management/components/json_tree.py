@@ -0,0 +1,171 @@
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from rich.text import Text
+from textual import on
+from textual.app import ComposeResult
+from textual.events import Show
+from textual.widgets import Input, Label, Static, Tree
+from textual.widgets.tree import TreeNode
+
+JsonPath = tuple[str | int, ...]
+
+
+@dataclass
+class JsonNodeData:
+    value: Any
+    loaded: bool = False
+
+
+class JsonTree(Static):
+    """A collapsible tree of a JSON-like document whose nodes are only built when their parent is expanded.
+
+    A new document is only turned into a tree once the widget is shown, and search walks the document itself so
+    only the nodes on the way to a match are ever built.
+    """
+
+    DEFAULT_CSS = """
+        JsonTree {
+            height: 1fr;
+        }
+        JsonTree > Input {
+            background: $panel;
+            border: none;
+            border-bottom: solid rgb(255,255,255) 30%;
+        }
+        JsonTree > Tree {
+            height: 1fr;
+            background: $panel;
+        }
+        JsonTree > .json-tree-status {
+            color: $text 40%;
+            width: 100%;
+            content-align: right middle;
+            padding: 0 1;
+        }
+    """
+
+    MAX_LABEL_LENGTH = 200
+    MAX_MATCHES = 1000
+
+    def __init__(self, label: str = "Response", **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._label = label
+        self._document: Any = {}
+        self._stale = True
+        self._matches: list[JsonPath] = []
+        self._match_index = -1
+        self._match_query = ""
+
+    def compose(self) -> ComposeResult:
+        self.search_input = Input(placeholder="Search keys and values, enter for next match")
+        yield self.search_input
+        self.tree_view: Tree[JsonNodeData] = Tree(self._label, data=JsonNodeData({}))
+        self.tree_view.show_root = False
+        yield self.tree_view
+        self._status_label = Label("", classes="json-tree-status")
+        yield self._status_label
+
+    def set_document(self, document: Any) -> None:
+        self._document = document
+        self._stale = True
+        self._matches = []
+        self._match_query = ""
+        if self.region:
+            self.build_tree()
+
+    def on_show(self, event: Show) -> None:
+        if self._stale:
+            self.build_tree()
+
+    def build_tree(self) -> None:
+        self._stale = False
+        self.tree_view.reset(self._label, JsonNodeData(self._document))
+        self.load_children(self.tree_view.root)
+        self.tree_view.root.expand()
+        self._status_label.update("")
+
+    def load_children(self, node: TreeNode[JsonNodeData]) -> None:
+        data = node.data
+        if data is None or data.loaded:
+            return
+        data.loaded = True
+        for key, value in self.items(data.value):
+            if isinstance(value, (dict, list)):
+                node.add(self.node_label(key, value), data=JsonNodeData(value))
+            else:
+                node.add_leaf(self.node_label(key, value), data=JsonNodeData(value, loaded=True))
+
+    @on(Tree.NodeExpanded)
+    def handle_node_expanded(self, message: Tree.NodeExpanded[JsonNodeData]) -> None:
+        self.load_children(message.node)
+
+    @staticmethod
+    def items(value: Any) -> Iterator[tuple[str | int, Any]]:
+        if isinstance(value, dict):
+            yield from value.items()
+        elif isinstance(value, list):
+            yield from enumerate(value)
+
+    def node_label(self, key: str | int, value: Any) -> Text:
+        label = Text(f"{key}", style="bold")
+        if isinstance(value, dict):
+            label.append(f" {{{len(value)} keys}}", style="dim")
+        elif isinstance(value, list):
+            label.append(f" [{len(value)} items]", style="dim")
+        else:
+            text = str(value)
+            if len(text) > self.MAX_LABEL_LENGTH:
+                text = text[: self.MAX_LABEL_LENGTH - 1] + "…"
+            label.append(f": {text}")
+        return label
+
+    @on(Input.Submitted)
+    def handle_search_submitted(self, message: Input.Submitted) -> None:
+        message.stop()
+        query = message.value.strip().lower()
+        if not query:
+            self._status_label.update("")
+            return
+        if query != self._match_query:
+            self._match_query = query
+            self._matches = list(self.find(self._document, query))
+            self._match_index = -1
+        if not self._matches:
+            self._status_label.update("No matches")
+            return
+        self._match_index = (self._match_index + 1) % len(self._matches)
+        more = "+" if len(self._matches) >= self.MAX_MATCHES else ""
+        self._status_label.update(f"{self._match_index + 1}/{len(self._matches)}{more} matches")
+        self.reveal(self._matches[self._match_index])
+
+    def find(self, document: Any, query: str) -> Iterator[JsonPath]:
+        """Paths of keys or scalar values containing `query`, depth first, without building any tree nodes."""
+        found = 0
+        stack: list[tuple[JsonPath, Any]] = [((), document)]
+        while stack and found < self.MAX_MATCHES:
+            path, value = stack.pop()
+            children = list(self.items(value))
+            for key, child in reversed(children):
+                stack.append(((*path, key), child))
+            if not path:
+                continue
+            key_matches = isinstance(path[-1], str) and query in path[-1].lower()
+            value_matches = not children and not isinstance(value, (dict, list)) and query in str(value).lower()
+            if key_matches or value_matches:
+                found += 1
+                yield path
+
+    def reveal(self, path: JsonPath) -> None:
+        node = self.tree_view.root
+        for key in path:
+            self.load_children(node)
+            node.expand()
+            value = node.data.value if node.data else None
+            index = list(value).index(key) if isinstance(value, dict) else key
+            node = node.children[index]
+        self.call_after_refresh(self.move_cursor, node)
+
+    def move_cursor(self, node: TreeNode[JsonNodeData]) -> None:
+        self.tree_view.select_node(node)
+        self.tree_view.scroll_to_node(node, animate=False)
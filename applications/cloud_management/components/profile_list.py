@@ -1,4 +1,3 @@
-import boto3
 from textual import work
 from textual.app import ComposeResult
 from textual.containers import Center, VerticalScroll
@@ -6,6 +5,8 @@ from textual.message import Message
 from textual.widgets import Input, OptionList, Static
 from textual.widgets.option_list import Option
 
+from ..services import client_pool
+
 PROFILE_LIST_INLINE_CSS = """
     #search {
         background: $panel;
@@ -94,9 +95,8 @@ class ProfileList(Static):
 
     @work(exclusive=True)
     async def find_available_profiles(self, word: str) -> None:
-        session = boto3.Session()
         self.option_list.clear_options()
-        for profile in session.available_profiles:
+        for profile in client_pool.available_profiles():
             self.option_list.add_option(Option(profile))
 
     async def on_option_list_option_selected(self, message: OptionList.OptionSelected) -> None:
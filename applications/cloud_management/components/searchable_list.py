@@ -1,12 +1,16 @@
 from dataclasses import dataclass
+from functools import partial
 from typing import Callable
 
 from textual import on, work
 from textual.app import ComposeResult
 from textual.message import Message
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widgets import Input, Label, ListItem, ListView, Static
 
+from ..models import SearchIndex
+
 SEARCHABLE_LIST_INLINE_CSS = """
     #search {
         background: $panel;
@@ -62,9 +66,25 @@ SEARCHABLE_LIST_INLINE_CSS = """
 """
 
 
+class FilteredListView(ListView):
+    """A `ListView` whose first `visible_count` children are the shown items and the rest are hidden."""
+
+    visible_count = 0
+
+    def validate_index(self, index: int | None) -> int | None:
+        if not self.visible_count or index is None:
+            return None
+        return self._clamp_index(index)
+
+    def _clamp_index(self, index: int) -> int:
+        return max(0, min(index, self.visible_count - 1))
+
+
 class SearchableList(Static, can_focus_children=True):
     DEFAULT_CSS = SEARCHABLE_LIST_INLINE_CSS
 
+    FILTER_DEBOUNCE_SECONDS = 0.05
+
     footer: reactive[str] = reactive("")
 
     @dataclass
@@ -73,6 +93,7 @@ class SearchableList(Static, can_focus_children=True):
         id: str
         disabled: bool = False
         user_data: dict | None = None
+        tooltip: str | None = None
 
     class Selected(Message):
         def __init__(self, list: "SearchableList", item: "SearchableList.ItemDatum") -> None:
@@ -84,19 +105,47 @@ class SearchableList(Static, can_focus_children=True):
         def control(self) -> "SearchableList":
             return self.list
 
+    class Loaded(Message):
+        def __init__(self, list: "SearchableList") -> None:
+            self.list = list
+            super().__init__()
+
+        @property
+        def control(self) -> "SearchableList":
+            return self.list
+
     def __init__(self, search_placeholder: str, item_factory: Callable[[], list[ItemDatum]], **kwargs) -> None:
         super().__init__(**kwargs)
         self._item_factory = item_factory
         self._search_placeholder = search_placeholder
+        self._items: list[SearchableList.ItemDatum] = []
+        self._items_index: dict[str, SearchableList.ItemDatum] = {}
+        self._item_positions: dict[str, int] = {}
+        self._search_index: SearchIndex[SearchableList.ItemDatum] = SearchIndex([])
+        self._last_query = ""
+        self._last_matches: list[int] | None = None
+        self._filter_timer: Timer | None = None
+        self._list_items: dict[str, ListItem] = {}
+        self._selected_id: str | None = None
+        self._highlighted_id: str | None = None
 
     def compose(self) -> ComposeResult:
         self._search_input = Input(placeholder=self._search_placeholder, id="search")
-        self._list_view = ListView(id="items-list")
+        self._list_view = FilteredListView(id="items-list")
         yield self._search_input
         yield self._list_view
         self._footer_label = Label(self.footer, classes="footer")
         yield self._footer_label
 
+    @property
+    def items(self) -> list["SearchableList.ItemDatum"]:
+        return self._items
+
+    @property
+    def filter_query(self) -> str:
+        """The query the shown items were last filtered with."""
+        return self._last_query
+
     def on_mount(self) -> None:
         self.compose_items()
 
@@ -117,24 +166,33 @@ class SearchableList(Static, can_focus_children=True):
     def fix_selected_classes(self, message: ListView.Selected) -> None:
         if not message.item:
             return
-        for item in message.list_view.children:
-            item.remove_class("list-view--item-selected")
-            item.add_class("list-view--item-not-selected")
+        previous_item = self._list_items.get(self._selected_id) if self._selected_id else None
+        if previous_item is not None:
+            previous_item.remove_class("list-view--item-selected")
+            previous_item.add_class("list-view--item-not-selected")
         message.item.remove_class("list-view--item-not-selected")
         message.item.add_class("list-view--item-selected")
+        self._selected_id = message.item.id
 
     def fix_highlighted_classes(self, message: ListView.Highlighted) -> None:
         if not message.item:
             return
-        for item in message.list_view.children:
-            item.remove_class("list-view--item-highlighted")
+        previous_item = self._list_items.get(self._highlighted_id) if self._highlighted_id else None
+        if previous_item is not None:
+            previous_item.remove_class("list-view--item-highlighted")
         message.item.add_class("list-view--item-highlighted")
+        self._highlighted_id = message.item.id
 
     @work(exclusive=True)
     async def compose_items(self) -> None:
         self._items = await self.get_items_from_factory().wait()
         self._items_index = {item.id: item for item in self._items}
+        self._item_positions = {item.id: position for position, item in enumerate(self._items)}
+        self._search_index = SearchIndex((item.title, item) for item in self._items)
+        self._last_query = ""
+        self._last_matches = None
         self.update_items(self._items)
+        self.post_message(self.Loaded(self))
 
     @work(thread=True)
     def get_items_from_factory(self) -> list["SearchableList.ItemDatum"]:
@@ -142,26 +200,97 @@ class SearchableList(Static, can_focus_children=True):
 
     async def on_input_changed(self, message: Input.Changed) -> None:
         """A coroutine to handle a text changed message."""
-        self.filter_items(message.value)
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(self.FILTER_DEBOUNCE_SECONDS, partial(self.filter_items, message.value))
 
-    @work(exclusive=True)
-    async def filter_items(self, word: str) -> None:
-        filtered_items = (
-            [item for item in self._items if word.lower().strip() in item.title.lower()]
-            if word.strip()
-            else self._items
-        )
-        self.update_items(filtered_items)
+    def filter_items(self, word: str) -> None:
+        query = word.lower().strip()
+        if not query:
+            self._last_query = ""
+            self._last_matches = None
+            self.update_items(self._items)
+            return
+        # A query that narrows the previous one can only match a subset of its results, so only those are scanned.
+        candidates = self._last_matches if SearchIndex.narrows(self._last_query, query) else None
+        self._last_matches = self._search_index.search(query, candidates)
+        self._last_query = query
+        self.update_items(self._search_index.values(self._last_matches))
 
     def update_items(self, items: list["SearchableList.ItemDatum"]) -> None:
-        self._list_view.clear()
-        for item in items:
-            disabled_class = " list-view--item-disabled" if item.disabled else ""
-            self._list_view.append(
-                ListItem(
-                    Label(item.title, classes="list-view-item"),
-                    id=item.id,
-                    classes="list-view--item-not-selected" + disabled_class,
-                )
-            )
+        list_view = self._list_view
+        highlighted_item = list_view.highlighted_child
+        if highlighted_item is not None:
+            highlighted_item.highlighted = False
+
+        shown_ids = {item.id for item in items}
+        stale_ids = [item_id for item_id in self._list_items if item_id not in self._items_index]
+        for item_id in stale_ids:
+            self._list_items.pop(item_id).remove()
+        new_list_items = [self.create_list_item(item) for item in items if item.id not in self._list_items]
+        if new_list_items:
+            self._list_items.update((list_item.id, list_item) for list_item in new_list_items)
+            list_view.mount(*new_list_items)
+
+        # Shown items are moved to the front in result order and the rest are hidden, so nothing is remounted.
+        for position, item in enumerate(items):
+            list_item = self._list_items[item.id]
+            if position >= len(list_view.children) or list_view.children[position] is not list_item:
+                list_view.move_child(list_item, before=position)
+            list_item.set_class(item.disabled, "list-view--item-disabled")
+            if not list_item.display:
+                list_item.display = True
+        for item_id, list_item in self._list_items.items():
+            if item_id not in shown_ids and list_item.display:
+                list_item.display = False
+
+        list_view.visible_count = len(items)
+        highlighted_position = next(
+            (position for position, item in enumerate(items) if item.id == self._highlighted_id), 0
+        )
+        list_view.index = highlighted_position if items else None
         self._footer_label.update(f"{len(items)}/{len(self._items)}")
+
+    def select_item(self, item_id: str) -> None:
+        """Highlight and select the item with `item_id`, clearing the search first if it hides the item."""
+        if item_id not in self._items_index:
+            return
+        list_view = self._list_view
+        shown = list_view.children[: list_view.visible_count]
+        position = next((position for position, child in enumerate(shown) if child.id == item_id), None)
+        if position is None:
+            if self._filter_timer is not None:
+                self._filter_timer.stop()
+            with self._search_input.prevent(Input.Changed):
+                self._search_input.value = ""
+            self.filter_items("")
+            position = self._item_positions[item_id]
+        list_view.index = position
+        list_view.action_select_cursor()
+
+    def update_item(self, item: "SearchableList.ItemDatum") -> None:
+        position = self._item_positions.get(item.id)
+        if position is None:
+            return
+        title_changed = self._items[position].title != item.title
+        self._items[position] = item
+        self._items_index[item.id] = item
+        self._search_index.update(position, item.title, item)
+        if title_changed:
+            # The previous matches may no longer hold for the new title.
+            self._last_matches = None
+            self._last_query = ""
+        list_item = self._list_items.get(item.id)
+        if list_item is not None:
+            list_item.set_class(item.disabled, "list-view--item-disabled")
+            list_item.tooltip = item.tooltip
+
+    def create_list_item(self, item: "SearchableList.ItemDatum") -> ListItem:
+        disabled_class = " list-view--item-disabled" if item.disabled else ""
+        list_item = ListItem(
+            Label(item.title, classes="list-view-item"),
+            id=item.id,
+            classes="list-view--item-not-selected" + disabled_class,
+        )
+        list_item.tooltip = item.tooltip
+        return list_item
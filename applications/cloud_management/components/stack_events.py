@@ -0,0 +1,221 @@
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from textual import on, work
+from textual.app import ComposeResult
+from textual.timer import Timer
+from textual.widgets import DataTable, Label, Static
+from textual.worker import get_current_worker
+
+from ..models import StackSummary
+from ..services import rate_limiter
+
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+
+
+class StackEvents(Static):
+    """Events of a stack, newest first, with lazily loaded history and a live tail.
+
+    At most `MAX_ROWS` events are kept. Older pages are only requested when the cursor gets close to the bottom of
+    the table, and the live tail only asks for events newer than the newest one already shown. Polling runs every
+    `FAST_POLL_SECONDS` while the stack is in progress and backs off up to `MAX_POLL_SECONDS` once it is not. It is
+    paused while the events are hidden, e.g. behind another tab, and catches up as soon as they are shown again.
+    """
+
+    DEFAULT_CSS = """
+        StackEvents {
+            height: 1fr;
+        }
+        StackEvents > DataTable {
+            height: 1fr;
+        }
+        StackEvents > .stack-events-status {
+            color: $text 40%;
+            width: 100%;
+            content-align: right middle;
+            padding: 0 1;
+        }
+    """
+
+    MAX_ROWS = 1000
+    LOAD_MORE_THRESHOLD = 10
+    FAST_POLL_SECONDS = 2.0
+    MAX_POLL_SECONDS = 60.0
+
+    def __init__(self, client: "BaseClient", **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._client = client
+        self._stack: StackSummary | None = None
+        self._stack_status = ""
+        self._event_ids: deque[str] = deque()
+        self._next_token: str | None = None
+        self._poll_timer: Timer | None = None
+        self._poll_interval = self.FAST_POLL_SECONDS
+        self._poll_paused = False
+        self._shown = False
+
+    def compose(self) -> ComposeResult:
+        self.table = DataTable(id="events-table", cursor_type="row")
+        self.table.add_column("Timestamp", key="timestamp")
+        self.table.add_columns("Logical Id", "Status", "Reason")
+        yield self.table
+        self._status_label = Label("", classes="stack-events-status")
+        yield self._status_label
+
+    @property
+    def row_count(self) -> int:
+        return self.table.row_count
+
+    def set_stack(self, stack: StackSummary | None) -> None:
+        self.stop_polling()
+        self.workers.cancel_group(self, "stack-events-history")
+        self.workers.cancel_group(self, "stack-events-tail")
+        self._stack = stack
+        self._stack_status = stack.stack_status if stack else ""
+        self._poll_interval = self.FAST_POLL_SECONDS
+        self.clear()
+
+    def clear(self) -> None:
+        self.table.clear()
+        self._event_ids.clear()
+        self._next_token = None
+        self.update_status()
+
+    def show_first_page(self, response: dict[str, Any]) -> None:
+        """Replace the shown events with the newest page of `describe_stack_events` and start the live tail."""
+        self.clear()
+        if self._stack is None:
+            return
+        self.add_older_events(self._stack.stack_id, response)
+        if "StackEvents" in response:
+            self.schedule_poll()
+
+    def add_older_events(self, stack_id: str | None, response: dict[str, Any]) -> None:
+        if self._stack is None or stack_id != self._stack.stack_id:
+            return
+        self._next_token = response.get("NextToken")
+        for event in response.get("StackEvents", []):
+            if len(self._event_ids) >= self.MAX_ROWS:
+                self._next_token = None
+                break
+            if self.add_event_row(event):
+                self._event_ids.append(event["EventId"])
+        if not self._stack_status:
+            self.track_stack_status(response.get("StackEvents", []))
+        self.update_status()
+
+    def add_newer_events(self, stack_id: str | None, events: list[dict[str, Any]]) -> None:
+        if self._stack is None or stack_id != self._stack.stack_id:
+            return
+        for event in reversed(events):
+            if not self.add_event_row(event):
+                continue
+            self._event_ids.appendleft(event["EventId"])
+            if len(self._event_ids) > self.MAX_ROWS:
+                self.table.remove_row(self._event_ids.pop())
+                self._next_token = None
+        if events:
+            self.table.sort("timestamp", reverse=True)
+            self.track_stack_status(events)
+        self.update_status()
+
+    def add_event_row(self, event: dict[str, Any]) -> bool:
+        event_id = event.get("EventId")
+        if not event_id or event_id in self.table.rows:
+            return False
+        fields = ["Timestamp", "LogicalResourceId", "ResourceStatus", "ResourceStatusReason"]
+        self.table.add_row(*(event.get(field, "") for field in fields), key=event_id)
+        return True
+
+    def track_stack_status(self, events: list[dict[str, Any]]) -> None:
+        """Follow the stack status from the newest stack-level event."""
+        for event in events:
+            if event.get("ResourceType") == "AWS::CloudFormation::Stack" and (
+                event.get("PhysicalResourceId") == event.get("StackId")
+            ):
+                self._stack_status = event.get("ResourceStatus", self._stack_status)
+                return
+
+    def update_status(self) -> None:
+        more = ", scroll down for older events" if self._next_token else ""
+        self._status_label.update(f"{len(self._event_ids)} events{more}")
+
+    @on(DataTable.RowHighlighted)
+    def handle_row_highlighted(self, message: DataTable.RowHighlighted) -> None:
+        if self._next_token and message.cursor_row >= self.table.row_count - self.LOAD_MORE_THRESHOLD:
+            self.load_older_events(self._stack, self._next_token)
+
+    @work(exclusive=True, thread=True, group="stack-events-history")
+    def load_older_events(self, stack: StackSummary | None, next_token: str) -> None:
+        if stack is None:
+            return
+        try:
+            response = self._client.describe_stack_events(StackName=stack.stack_id, NextToken=next_token)
+        except Exception:
+            self.notify("Can't get older stack events", severity="error")
+            return
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self.add_older_events, stack.stack_id, response)
+
+    def on_show(self) -> None:
+        self._shown = True
+        if self._poll_paused:
+            self._poll_paused = False
+            self.start_poll()
+
+    def on_hide(self) -> None:
+        self._shown = False
+        if self._poll_timer is not None:
+            self.stop_polling()
+            self._poll_paused = True
+
+    def schedule_poll(self) -> None:
+        self.stop_polling()
+        if not self._shown:
+            self._poll_paused = True
+            return
+        self._poll_timer = self.set_timer(self._poll_interval, self.start_poll)
+
+    def stop_polling(self) -> None:
+        self._poll_paused = False
+        if self._poll_timer is not None:
+            self._poll_timer.stop()
+            self._poll_timer = None
+
+    def start_poll(self) -> None:
+        if self._stack is not None:
+            self.poll_new_events(self._stack, self._event_ids[0] if self._event_ids else None)
+
+    @work(exclusive=True, thread=True, group="stack-events-tail")
+    def poll_new_events(self, stack: StackSummary, newest_event_id: str | None) -> None:
+        worker = get_current_worker()
+        new_events: list[dict[str, Any]] = []
+        request: dict[str, Any] = {"StackName": stack.stack_id}
+        try:
+            with rate_limiter.background():
+                while len(new_events) < self.MAX_ROWS and not worker.is_cancelled:
+                    response = self._client.describe_stack_events(**request)
+                    for event in response.get("StackEvents", []):
+                        if event.get("EventId") == newest_event_id:
+                            break
+                        new_events.append(event)
+                    else:
+                        if newest_event_id and response.get("NextToken"):
+                            request["NextToken"] = response["NextToken"]
+                            continue
+                    break
+        except Exception:
+            new_events = []
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self.handle_polled_events, stack.stack_id, new_events)
+
+    def handle_polled_events(self, stack_id: str | None, events: list[dict[str, Any]]) -> None:
+        if self._stack is None or stack_id != self._stack.stack_id:
+            return
+        self.add_newer_events(stack_id, events)
+        if events or self._stack_status.endswith("_IN_PROGRESS"):
+            self._poll_interval = self.FAST_POLL_SECONDS
+        else:
+            self._poll_interval = min(self._poll_interval * 2, self.MAX_POLL_SECONDS)
+        self.schedule_poll()
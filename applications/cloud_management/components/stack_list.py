@@ -0,0 +1,229 @@
+from typing import Any, ClassVar
+
+from rich.segment import Segment
+from rich.text import Text
+from textual.binding import Binding, BindingType
+from textual.events import Click, Resize
+from textual.geometry import Region, Size
+from textual.message import Message
+from textual.reactive import reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+from ..models import StackSummary
+
+
+def stack_status_color(stack_status: str) -> str | None:
+    return (
+        ("dark_green" if stack_status.endswith("_COMPLETE") else None)
+        or ("dark_orange3" if stack_status.endswith("_IN_PROGRESS") else None)
+        or ("dark_red" if stack_status.endswith("_FAILED") else None)
+    )
+
+
+class StackList(ScrollView, can_focus=True):
+    """A virtualized list of stacks.
+
+    Stacks are kept in parallel lists of strings and a row is only turned into segments when it is on screen, so
+    the cost of building and scrolling the list doesn't grow with the number of stacks.
+    """
+
+    DEFAULT_CSS = """
+        StackList {
+            height: 1fr;
+            overflow-x: hidden;
+            background: $panel;
+        }
+        StackList > .stack-list--option-highlighted {
+            background: $secondary;
+        }
+        StackList > .stack-list--separator {
+            color: rgb(255,255,255) 30%;
+        }
+    """
+
+    COMPONENT_CLASSES: ClassVar[set[str]] = {"stack-list--option-highlighted", "stack-list--separator"}
+
+    BINDINGS: ClassVar[list[BindingType]] = [
+        Binding("down", "cursor_down", "Down", show=False),
+        Binding("up", "cursor_up", "Up", show=False),
+        Binding("home", "first", "First", show=False),
+        Binding("end", "last", "Last", show=False),
+        Binding("pagedown", "page_down", "Page Down", show=False),
+        Binding("pageup", "page_up", "Page Up", show=False),
+        Binding("enter", "select", "Select", show=False),
+    ]
+
+    ROW_HEIGHT = 3
+
+    highlighted: reactive[int | None] = reactive(None)
+
+    class Selected(Message):
+        def __init__(self, stack_list: "StackList", index: int, stack: StackSummary) -> None:
+            self.stack_list = stack_list
+            self.index = index
+            self.stack = stack
+            super().__init__()
+
+        @property
+        def control(self) -> "StackList":
+            return self.stack_list
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._names: list[str] = []
+        self._statuses: list[str] = []
+        self._ids: list[str | None] = []
+        self._updated_times: list[str] = []
+        self._index: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def append(self, stack_summaries: list[dict[str, Any]]) -> None:
+        for stack_summary in stack_summaries:
+            stack = StackSummary.from_response(stack_summary)
+            if stack.stack_id:
+                # A stack the status watch found may show up again in a page of the list that is still loading.
+                if stack.stack_id in self._index:
+                    continue
+                self._index[stack.stack_id] = len(self._names)
+            self._names.append(stack.stack_name)
+            self._statuses.append(stack.stack_status)
+            self._ids.append(stack.stack_id)
+            self._updated_times.append(stack.last_updated_time)
+        self._update_virtual_size()
+        self.refresh()
+
+    def update_statuses(self, stack_summaries: list[dict[str, Any]]) -> list[StackSummary]:
+        """Update known stacks in place, repainting only the rows whose status changed, and return those stacks."""
+        changed = []
+        for stack_summary in stack_summaries:
+            stack = StackSummary.from_response(stack_summary)
+            index = self._index.get(stack.stack_id or "")
+            if index is None or self._statuses[index] == stack.stack_status:
+                continue
+            self._statuses[index] = stack.stack_status
+            self._updated_times[index] = stack.last_updated_time
+            self.refresh_row(index)
+            changed.append(stack)
+        return changed
+
+    def in_progress_stack_ids(self) -> list[str]:
+        return [
+            stack_id
+            for stack_id, stack_status in zip(self._ids, self._statuses)
+            if stack_id and stack_status.endswith("_IN_PROGRESS")
+        ]
+
+    def clear(self) -> None:
+        self._names.clear()
+        self._statuses.clear()
+        self._ids.clear()
+        self._updated_times.clear()
+        self._index.clear()
+        self.highlighted = None
+        self._update_virtual_size()
+        self.scroll_home(animate=False)
+        self.refresh()
+
+    def get_stack(self, index: int) -> StackSummary:
+        return StackSummary(
+            stack_name=self._names[index],
+            stack_status=self._statuses[index],
+            stack_id=self._ids[index],
+            last_updated_time=self._updated_times[index],
+        )
+
+    def index_of(self, stack_id: str) -> int | None:
+        return self._index.get(stack_id)
+
+    def jump_to(self, index: int) -> None:
+        self.highlighted = index
+        self.scroll_to_highlight(top=True)
+
+    def render_line(self, y: int) -> Strip:
+        width = self.scrollable_content_region.width
+        index, row_line = divmod(self.scroll_offset.y + y, self.ROW_HEIGHT)
+        if index >= len(self._names):
+            return Strip.blank(width, self.rich_style)
+        if row_line == self.ROW_HEIGHT - 1:
+            separator_style = self.get_component_rich_style("stack-list--separator")
+            return Strip([Segment("─" * width, separator_style)], width)
+
+        if row_line == 0:
+            text = Text(self._names[index], style="bold")
+        else:
+            stack_status = self._statuses[index]
+            text = Text(stack_status, style=stack_status_color(stack_status) or "")
+        text.truncate(width, overflow="ellipsis", pad=True)
+        row_style = (
+            self.get_component_rich_style("stack-list--option-highlighted")
+            if index == self.highlighted
+            else self.rich_style
+        )
+        return Strip(text.render(self.app.console), width).apply_style(row_style)
+
+    def refresh_row(self, index: int) -> None:
+        region = Region(0, index * self.ROW_HEIGHT, self.scrollable_content_region.width, self.ROW_HEIGHT - 1)
+        if self.window_region.overlaps(region):
+            self.refresh(region.translate(-self.scroll_offset))
+
+    def scroll_to_highlight(self, top: bool = False) -> None:
+        if self.highlighted is None:
+            return
+        self.scroll_to_region(
+            Region(0, self.highlighted * self.ROW_HEIGHT, self.scrollable_content_region.width, self.ROW_HEIGHT - 1),
+            force=True,
+            animate=False,
+            top=top,
+        )
+
+    def validate_highlighted(self, highlighted: int | None) -> int | None:
+        if not self._names or highlighted is None:
+            return None
+        return max(0, min(highlighted, len(self._names) - 1))
+
+    def watch_highlighted(self) -> None:
+        self.scroll_to_highlight()
+        self.refresh()
+
+    def on_resize(self, event: Resize) -> None:
+        self._update_virtual_size()
+
+    def on_click(self, event: Click) -> None:
+        offset = event.get_content_offset(self)
+        if offset is None:
+            return
+        index = (offset.y + self.scroll_offset.y) // self.ROW_HEIGHT
+        if index < len(self._names):
+            self.highlighted = index
+            self.action_select()
+
+    def action_cursor_down(self) -> None:
+        self.highlighted = 0 if self.highlighted is None else self.highlighted + 1
+
+    def action_cursor_up(self) -> None:
+        self.highlighted = 0 if self.highlighted is None else self.highlighted - 1
+
+    def action_first(self) -> None:
+        self.highlighted = 0
+
+    def action_last(self) -> None:
+        self.highlighted = len(self._names) - 1
+
+    def action_page_down(self) -> None:
+        page_rows = max(1, self.scrollable_content_region.height // self.ROW_HEIGHT)
+        self.highlighted = (self.highlighted or 0) + page_rows
+
+    def action_page_up(self) -> None:
+        page_rows = max(1, self.scrollable_content_region.height // self.ROW_HEIGHT)
+        self.highlighted = (self.highlighted or 0) - page_rows
+
+    def action_select(self) -> None:
+        if self.highlighted is not None:
+            self.post_message(self.Selected(self, self.highlighted, self.get_stack(self.highlighted)))
+
+    def _update_virtual_size(self) -> None:
+        height = max(0, len(self._names) * self.ROW_HEIGHT - 1)
+        self.virtual_size = Size(self.scrollable_content_region.width, height)
@@ -0,0 +1,86 @@
+from collections import OrderedDict
+
+from pygments.lexers import get_lexer_by_name
+from rich.syntax import Syntax
+from rich.text import Text
+from textual.geometry import Size
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+
+class TemplateView(ScrollView, can_focus=True):
+    """A read-only view of a stack template that only highlights the lines it draws.
+
+    The template is split into lines once; each line is highlighted the first time it scrolls into view and kept in
+    a bounded cache, so opening a large template costs the same as opening a small one.
+    """
+
+    DEFAULT_CSS = """
+        TemplateView {
+            height: 1fr;
+            background: $panel;
+        }
+        TemplateView > .template-view--line-number {
+            color: $text 40%;
+        }
+    """
+
+    COMPONENT_CLASSES = {"template-view--line-number"}
+
+    MAX_CACHED_LINES = 2000
+    THEME = "monokai"
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._lines: list[str] = []
+        self._syntax = Syntax("", get_lexer_by_name("yaml"), theme=self.THEME)
+        self._highlighted: OrderedDict[int, Text] = OrderedDict()
+        self._gutter_width = 0
+
+    def update(self, template_body: str) -> None:
+        self._lines = template_body.splitlines()
+        lexer = "json" if template_body.lstrip().startswith(("{", "[")) else "yaml"
+        # A lexer instance, rather than its name, so it isn't looked up again for every highlighted line.
+        self._syntax = Syntax("", get_lexer_by_name(lexer), theme=self.THEME)
+        self._highlighted.clear()
+        self._gutter_width = len(str(len(self._lines))) + 2
+        width = max((len(line) for line in self._lines), default=0) + self._gutter_width
+        self.virtual_size = Size(width, len(self._lines))
+        self.scroll_home(animate=False)
+        self.refresh()
+
+    @property
+    def line_count(self) -> int:
+        return len(self._lines)
+
+    def highlight_line(self, index: int) -> Text:
+        text = self._highlighted.get(index)
+        if text is None:
+            text = self._syntax.highlight(self._lines[index])
+            text.rstrip()
+            self._highlighted[index] = text
+            if len(self._highlighted) > self.MAX_CACHED_LINES:
+                self._highlighted.popitem(last=False)
+        else:
+            self._highlighted.move_to_end(index)
+        return text
+
+    def render_line(self, y: int) -> Strip:
+        width = self.scrollable_content_region.width
+        scroll_x, scroll_y = self.scroll_offset
+        index = scroll_y + y
+        if index >= len(self._lines):
+            return Strip.blank(width, self.rich_style)
+        gutter = Text(
+            f"{index + 1:>{self._gutter_width - 2}}  ",
+            style=self.get_component_rich_style("template-view--line-number"),
+        )
+        # The line numbers stay put while the template scrolls sideways.
+        content_width = max(0, width - self._gutter_width)
+        content = Strip(self.highlight_line(index).render(self.app.console))
+        return Strip.join(
+            [
+                Strip(gutter.render(self.app.console), self._gutter_width),
+                content.crop_extend(scroll_x, scroll_x + content_width, self.rich_style),
+            ]
+        )
@@ -1,3 +1,8 @@
+from .entity import Entity
+from .page_snapshot import CloudFormationSnapshot
+from .region import Region
+from .search_index import SearchIndex
 from .service_path import ServicePath
+from .stack_summary import StackSummary
 
-__all__ = ["ServicePath"]
+__all__ = ["CloudFormationSnapshot", "Entity", "Region", "SearchIndex", "ServicePath", "StackSummary"]
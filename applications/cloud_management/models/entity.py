@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+from .service_path import ServicePath
+
+
+@dataclass(frozen=True)
+class Entity:
+    """Something loaded from AWS that can be searched for and jumped to, such as a stack, resource or output."""
+
+    kind: str
+    name: str
+    service_path: ServicePath
+    stack_id: str | None = None
+    stack_name: str = ""
+    aliases: tuple[str, ...] = ()
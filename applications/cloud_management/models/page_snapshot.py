@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CloudFormationSnapshot:
+    stack_id: str | None = None
+    active_tab: str | None = None
+    scroll_y: float = 0
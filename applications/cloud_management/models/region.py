@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Region:
+    region_name: str
+    display_name: str
+
+    @property
+    def title(self) -> str:
+        return f"{self.region_name} ({self.display_name})"
@@ -0,0 +1,119 @@
+import re
+from typing import Generic, Iterable, TypeVar
+
+ValueType = TypeVar("ValueType")
+
+TOKEN_SEPARATORS = re.compile(r"[\s\-_()./:,]+")
+# An acronym or a capitalised or lower-case word, with any digits that follow: "EC2InstanceRoleV2" is "EC2",
+# "Instance", "Role" and "V2".
+CAMEL_CASE_WORD = re.compile(r"[A-Z]+[0-9]*(?![a-z])|[A-Z]?[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    return [token for token in TOKEN_SEPARATORS.split(text.lower()) if token]
+
+
+def camel_case_words(text: str) -> list[str]:
+    """The case-folded words of CamelCase identifiers in `text`, e.g. "lambda", "function", "role"."""
+    return [word.lower() for part in TOKEN_SEPARATORS.split(text) for word in CAMEL_CASE_WORD.findall(part)]
+
+
+class SearchIndex(Generic[ValueType]):
+    """Pre-computed, case-folded search index over a fixed list of titles.
+
+    Every query token has to match a title for it to be a result. A token scores highest as a prefix of the whole
+    title, then as a prefix of one of its words, then as a substring and lastly as a fuzzy subsequence.
+    """
+
+    MIN_FUZZY_TOKEN_LENGTH = 3
+    # What a token scores for being the whole title; every other kind of match scores less.
+    MAX_TOKEN_SCORE = 150.0
+
+    def __init__(self, entries: Iterable[tuple[str, ValueType]]) -> None:
+        self._titles: list[str] = []
+        self._words: list[list[str]] = []
+        self._values: list[ValueType] = []
+        for title, value in entries:
+            self._titles.append(title.lower())
+            self._words.append(tokenize(title))
+            self._values.append(value)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def value(self, position: int) -> ValueType:
+        return self._values[position]
+
+    def values(self, positions: Iterable[int]) -> list[ValueType]:
+        return [self._values[position] for position in positions]
+
+    def update(self, position: int, title: str, value: ValueType) -> None:
+        """Replace the entry at `position`, keeping the positions of all the others."""
+        self._titles[position] = title.lower()
+        self._words[position] = tokenize(title)
+        self._values[position] = value
+
+    def search(self, query: str, candidates: Iterable[int] | None = None) -> list[int]:
+        """Return the positions of matching entries, best match first."""
+        tokens = tokenize(query)
+        if candidates is None:
+            candidates = range(len(self._values))
+        if not tokens:
+            return list(candidates)
+        scored: list[tuple[float, int]] = []
+        for position in candidates:
+            score = self.score(position, tokens)
+            if score > 0:
+                scored.append((-score, position))
+        scored.sort()
+        return [position for _, position in scored]
+
+    @classmethod
+    def narrows(cls, previous_query: str, query: str) -> bool:
+        """Whether everything `query` matches was matched by `previous_query`, so only its results need searching.
+
+        Extending a query only narrows it once each of its tokens is long enough to match fuzzily: before that, a
+        longer token can match titles as a subsequence that the shorter one didn't match at all.
+        """
+        return (
+            bool(previous_query)
+            and query.startswith(previous_query)
+            and all(len(token) >= cls.MIN_FUZZY_TOKEN_LENGTH for token in tokenize(previous_query))
+        )
+
+    def score(self, position: int, tokens: list[str]) -> float:
+        title = self._titles[position]
+        words = self._words[position]
+        total = 0.0
+        for token in tokens:
+            if title.startswith(token):
+                token_score = self.MAX_TOKEN_SCORE if title == token else 100.0
+            elif any(word.startswith(token) for word in words):
+                token_score = 60.0
+            elif token in title:
+                token_score = 40.0
+            elif len(token) >= self.MIN_FUZZY_TOKEN_LENGTH:
+                token_score = self._fuzzy_score(title, token)
+            else:
+                token_score = 0.0
+            if token_score <= 0:
+                return 0.0
+            total += token_score
+        return total
+
+    def normalized_score(self, position: int, tokens: list[str]) -> float:
+        """`score` scaled to between 0 and 1, where 1 means every token is the whole title."""
+        return self.score(position, tokens) / (self.MAX_TOKEN_SCORE * len(tokens)) if tokens else 0.0
+
+    @staticmethod
+    def _fuzzy_score(title: str, token: str) -> float:
+        start = title.find(token[0])
+        if start < 0:
+            return 0.0
+        position = start
+        for char in token[1:]:
+            position = title.find(char, position + 1)
+            if position < 0:
+                return 0.0
+        span = position - start + 1
+        return 20.0 * len(token) / span
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class StackSummary:
+    stack_name: str
+    stack_status: str
+    stack_id: str | None = None
+    last_updated_time: str = ""
+
+    @classmethod
+    def from_response(cls, stack_summary: dict[str, Any]) -> "StackSummary":
+        last_updated_time = stack_summary.get("LastUpdatedTime") or stack_summary.get("CreationTime") or ""
+        return cls(
+            stack_name=stack_summary.get("StackName", "NoName!"),
+            stack_status=stack_summary.get("StackStatus", "NO_STATUS"),
+            stack_id=stack_summary.get("StackId"),
+            last_updated_time=str(last_updated_time),
+        )
+
+    @property
+    def in_progress(self) -> bool:
+        return self.stack_status.endswith("_IN_PROGRESS")
+
+    @property
+    def cache_key(self) -> tuple[str, str]:
+        return (self.stack_id or self.stack_name, self.last_updated_time)
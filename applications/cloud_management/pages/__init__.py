@@ -1,4 +1,6 @@
 from .cloudformation import CloudFormation
+from .global_stacks import GlobalStacks
+from .s3 import S3
 from .welcome import Welcome
 
-__all__ = ["CloudFormation", "Welcome"]
+__all__ = ["CloudFormation", "GlobalStacks", "S3", "Welcome"]
@@ -1,46 +1,40 @@
-from typing import Any
+import asyncio
+import json
+import time
+from concurrent.futures import CancelledError
+from functools import partial
+from typing import Any, Callable
 
-import boto3
-from botocore.exceptions import SSOTokenLoadError, UnauthorizedSSOTokenError
-from rich.text import Text
 from textual import on, work
 from textual.app import ComposeResult
-from textual.containers import Horizontal, VerticalScroll
-from textual.widgets import DataTable, Label, OptionList, Pretty, Static, TabbedContent, TabPane
-from textual.widgets.option_list import Option, Separator
-
-from ..models import ServicePath
-
-
-class StackOption(Option):
-    def __init__(self, stack_summary: dict[str, Any], id: str | None = None, disabled: bool = False) -> None:
-        self.stack_summary = stack_summary
-        stack_name = stack_summary.get("StackName", "NoName!")
-        stack_status = stack_summary.get("StackStatus", "NO_STATUS")
-        status_status_color = (
-            ("dark_green" if stack_status.endswith("_COMPLETE") else None)
-            or ("dark_orange3" if stack_status.endswith("_IN_PROGRESS") else None)
-            or ("dark_red" if stack_status.endswith("_FAILED") else None)
-        )
-        prompt = Text.assemble(
-            Text(f"{stack_name}\n", style="bold"),
-            Text(stack_status, style=status_status_color),
-            no_wrap=True,
-            overflow="ellipsis",
-        )
-        super().__init__(prompt, id, disabled)
+from textual.containers import Horizontal, Vertical, VerticalScroll
+from textual.timer import Timer
+from textual.widgets import DataTable, Label, Static, TabbedContent, TabPane
+from textual.worker import get_current_worker
 
-    @property
-    def stack_name(self) -> str:
-        return self.stack_summary.get("StackName", "NoName!")
+from ..components import JsonTree, StackEvents, StackList, TemplateView
+from ..models import CloudFormationSnapshot, Entity, ServicePath, StackSummary
+from ..services import (
+    client_pool,
+    entity_index,
+    is_throttling_error,
+    rate_limiter,
+    single_flight,
+    stack_details_cache,
+    stack_summaries_cache,
+    template_cache,
+)
+from ..strings import AWS_LISTED_STACK_STATUSES, AWS_STACK_STATUSES
 
-    @property
-    def stack_status(self) -> str:
-        return self.stack_summary.get("StackStatus", "NO_STATUS")
-
-    @property
-    def stack_id(self) -> str | None:
-        return self.stack_summary.get("StackId")
+STACK_DETAIL_GROUPS = ["describe-stacks", "list-stack-resources", "describe-stack-events", "get-template"]
+STACK_SELECTION_DEBOUNCE_SECONDS = 0.1
+IN_PROGRESS_STACK_DETAILS_TTL = 5
+RESOURCE_ROWS_CHUNK_SIZE = 200
+STACK_STATUS_FILTER = AWS_LISTED_STACK_STATUSES
+IN_PROGRESS_STACK_STATUSES = [status for status in AWS_STACK_STATUSES if status.endswith("_IN_PROGRESS")]
+STACK_STATUS_WATCH_SECONDS = 5
+# How often to look for stacks that started changing while none of the listed ones are in progress.
+STACK_STATUS_IDLE_WATCH_SECONDS = 30
 
 
 class CloudFormation(Static):
@@ -74,21 +68,37 @@ class CloudFormation(Static):
         TabPane.stack-tab-pane {
             height: 1fr;
         }
+        #resources-table {
+            height: 1fr;
+        }
+        #resources-progress {
+            color: $text 40%;
+            width: 100%;
+            content-align: right middle;
+            padding: 0 1;
+        }
     """
 
-    def __init__(self, service_path: ServicePath, **kwargs) -> None:
+    def __init__(self, service_path: ServicePath, snapshot: CloudFormationSnapshot | None = None, **kwargs) -> None:
         super().__init__(**kwargs)
         if not service_path.completed or service_path.service_name != "cloudformation":
             raise ValueError("Invalid service path len")
         self._service_path = service_path
-        self._session = boto3.Session(profile_name=service_path.profile_name, region_name=service_path.region_name)
-        self._client = self._session.client(service_path.service_name)
+        self._client = client_pool.client(service_path)
+        self._status_watch_timer: Timer | None = None
+        self._status_polled_at = 0.0
+        self._stack_details_timer: Timer | None = None
+        self._stacks_loaded = False
+        self._pending_stack_id: str | None = None
+        self._pending_tab: str | None = None
+        self._selected_stack: StackSummary | None = None
+        self._snapshot = snapshot
 
     def compose(self) -> ComposeResult:
         with Horizontal(classes="main-container"):
-            with VerticalScroll(classes="stack-list-container"):
-                self._option_list = OptionList(id="stack-list")
-                yield self._option_list
+            with Vertical(classes="stack-list-container"):
+                self._stack_list = StackList(id="stack-list")
+                yield self._stack_list
             with VerticalScroll(classes="stack-details-container"):
                 with TabbedContent() as self.tabbed_content:
                     with TabPane("Properties", id="properties", classes="stack-tab-pane"):
@@ -108,36 +118,170 @@ class CloudFormation(Static):
                         self.tags_table.add_columns("Key", "Value")
                         yield self.tags_table
                     with TabPane("Events", id="events", classes="stack-tab-pane"):
-                        yield Label("Events")
+                        self.events_view = StackEvents(self._client, id="stack-events")
+                        yield self.events_view
                     with TabPane("Resources", id="resources", classes="stack-tab-pane"):
                         self.resources_table = DataTable(name="Resources", id="resources-table")
                         self.resources_table.add_columns("Logical Id", "Physical Id", "Type", "Status")
                         yield self.resources_table
-                        yield Label("Resources")
+                        self.resources_progress = Label("", id="resources-progress")
+                        yield self.resources_progress
+                    with TabPane("Template", id="template", classes="stack-tab-pane"):
+                        self.template_view = TemplateView(id="template-view")
+                        yield self.template_view
                     with TabPane("Response", id="response", classes="stack-tab-pane"):
-                        yield Pretty({})
+                        self.response_tree = JsonTree("DescribeStacks", id="response-tree")
+                        yield self.response_tree
 
     def on_mount(self) -> None:
+        # A stack or tab asked for through show_stack() before the page was mounted wins over the snapshot's.
+        if self._snapshot is not None:
+            if self._snapshot.active_tab and self._pending_tab is None:
+                self.tabbed_content.active = self._snapshot.active_tab
+            if self._snapshot.stack_id and self._pending_stack_id is None:
+                self._pending_stack_id = self._snapshot.stack_id
         # self.mock_list_stacks()
         self.list_stacks()
 
-    @work(exclusive=True, thread=True)
+    def snapshot(self) -> CloudFormationSnapshot:
+        """What it takes to rebuild this page as the user left it, e.g. after it has been suspended."""
+        return CloudFormationSnapshot(
+            stack_id=self._selected_stack.stack_id if self._selected_stack else None,
+            active_tab=self.tabbed_content.active,
+            scroll_y=self._stack_list.scroll_y,
+        )
+
+    @work(exclusive=True, thread=True, group="list-stacks")
     def list_stacks(self) -> None:
+        from botocore.exceptions import SSOTokenLoadError, UnauthorizedSSOTokenError
+
+        worker = get_current_worker()
+        self.app.call_from_thread(self._stack_list.clear)
+        cached = stack_summaries_cache.get(self._service_path.id)
+        if cached is not None and cached.fresh:
+            self.app.call_from_thread(self._stack_list.append, cached.value)
+            self.index_stacks(cached.value)
+            self.app.call_from_thread(self.handle_stacks_loaded)
+            return
+        stack_summaries: list[dict[str, Any]] = []
+        paginator = self._client.get_paginator("list_stacks")
         try:
-            response = self._client.list_stacks()
+            for page in paginator.paginate(StackStatusFilter=STACK_STATUS_FILTER):
+                if worker.is_cancelled:
+                    return
+                page_summaries = page.get("StackSummaries", [])
+                # The first page replaces the stacks indexed before, so they are searchable as soon as they are listed.
+                self.index_stacks(page_summaries, replace=not stack_summaries)
+                stack_summaries.extend(page_summaries)
+                self.app.call_from_thread(self._stack_list.append, page_summaries)
+            stack_summaries_cache.set(self._service_path.id, stack_summaries)
+            self.app.call_from_thread(self.handle_stacks_loaded)
         except SSOTokenLoadError:
             self.notify(f"Error loading {self._service_path.profile_name} profile SSO token.", severity="error")
-            return
+            self.app.call_from_thread(self.handle_stacks_failed)
         except UnauthorizedSSOTokenError:
             self.notify(f"Unauthorized {self._service_path.profile_name} profile SSO token.", severity="error")
+            self.app.call_from_thread(self.handle_stacks_failed)
+        except Exception as error:
+            if is_throttling_error(error):
+                self.notify("AWS is throttling requests, can't get list of stacks.", severity="error")
+            else:
+                self.notify("Can't get list of stacks.", severity="error")
+            self.app.call_from_thread(self.handle_stacks_failed)
+
+    def handle_stacks_failed(self) -> None:
+        # A stack waiting for the list would otherwise be shown whenever a later reload succeeds.
+        if self._pending_stack_id is not None:
+            self.notify("Can't open the stack without the list of stacks.", severity="warning")
+        self._pending_stack_id = None
+        self._pending_tab = None
+
+    def handle_stacks_loaded(self) -> None:
+        self._stacks_loaded = True
+        if self._pending_stack_id is not None:
+            self.show_stack(self._pending_stack_id, self._pending_tab)
+        if self._snapshot is not None:
+            self._stack_list.scroll_to(y=self._snapshot.scroll_y, animate=False)
+            self._snapshot = None
+        self.start_status_watch()
+
+    def show_stack(self, stack_id: str, tab: str | None = None) -> None:
+        """Highlight and select a stack, and optionally one of its tabs, waiting for the stack list to load."""
+        if not self._stacks_loaded:
+            self._pending_stack_id = stack_id
+            self._pending_tab = tab
             return
-        except Exception:
-            self.notify("Can't get list of stacks.", severity="error")
+        self._pending_stack_id = None
+        self._pending_tab = None
+        if tab is not None:
+            self.tabbed_content.active = tab
+        index = self._stack_list.index_of(stack_id)
+        if index is None:
+            self.notify("Can't find the stack in this region.", severity="warning")
+            return
+        self._stack_list.jump_to(index)
+        self._stack_list.focus()
+        self._stack_list.action_select()
+
+    def start_status_watch(self) -> None:
+        if self._status_watch_timer is None:
+            self._status_watch_timer = self.set_interval(STACK_STATUS_WATCH_SECONDS, self.poll_stack_statuses)
+
+    def poll_stack_statuses(self) -> None:
+        # Paused while another tab or screen covers the page; the next tick after it's shown again catches up.
+        if self.app.screen is not self.screen or not self.region:
             return
+        stack_ids = self._stack_list.in_progress_stack_ids()
+        # Stacks that start an operation later are still picked up, just less often while nothing else is running.
+        if not stack_ids and time.monotonic() - self._status_polled_at < STACK_STATUS_IDLE_WATCH_SECONDS:
+            return
+        self._status_polled_at = time.monotonic()
+        self.watch_stack_statuses(stack_ids)
+
+    @work(exclusive=True, thread=True, group="stack-status-watch")
+    def watch_stack_statuses(self, stack_ids: list[str]) -> None:
+        """Fetch the current status of every in-progress stack and of the given ones that were in progress.
+
+        A single paginated `list_stacks` filtered to in-progress statuses covers every stack that is running now,
+        including ones that weren't when the list was loaded; only the given stacks that dropped out of it are
+        described one by one to learn how they ended.
+        """
+        worker = get_current_worker()
+        summaries: list[dict[str, Any]] = []
+        with rate_limiter.background():
+            try:
+                paginator = self._client.get_paginator("list_stacks")
+                for page in paginator.paginate(StackStatusFilter=IN_PROGRESS_STACK_STATUSES):
+                    summaries.extend(page.get("StackSummaries", []))
+                still_in_progress = {summary.get("StackId") for summary in summaries}
+            except Exception:
+                return
+            for stack_id in stack_ids:
+                if worker.is_cancelled:
+                    return
+                if stack_id in still_in_progress:
+                    continue
+                try:
+                    summaries.extend(self._client.describe_stacks(StackName=stack_id).get("Stacks", []))
+                except Exception:
+                    continue
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self.update_stack_statuses, summaries)
 
-        self.update_option_list(response.get("StackSummaries", []))
+    def update_stack_statuses(self, stack_summaries: list[dict[str, Any]]) -> None:
+        changed = self._stack_list.update_statuses(stack_summaries)
+        new_stacks = [
+            summary
+            for summary in stack_summaries
+            if summary.get("StackId") and self._stack_list.index_of(summary["StackId"]) is None
+        ]
+        if new_stacks:
+            self._stack_list.append(new_stacks)
+            self.index_stacks(new_stacks, replace=False)
+        if changed or new_stacks:
+            stack_summaries_cache.invalidate(self._service_path.id)
 
-    @work(exclusive=True, thread=True)
+    @work(exclusive=True, thread=True, group="list-stacks")
     def mock_list_stacks(self) -> None:
         example_response = {
             "StackSummaries": [
@@ -147,53 +291,191 @@ class CloudFormation(Static):
                 {"StackName": "Stack4", "StackStatus": "CREATE_FAILED"},
             ]
         }
-        self.update_option_list(example_response.get("StackSummaries", []))
+        self.app.call_from_thread(self._stack_list.clear)
+        self.app.call_from_thread(self._stack_list.append, example_response.get("StackSummaries", []))
 
-    @work(exclusive=True, thread=True)
-    def describe_stacks(self, stack_id: str) -> dict[str, Any]:
+    def request_once(self, stack: StackSummary, operation: str, fetch: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        """Run `fetch` unless the same operation for the same stack is already in flight, and share its response."""
+        key = (self._service_path.profile_name, self._service_path.region_name, operation, stack.stack_id)
+        return single_flight.do(key, fetch)
+
+    def call_stack_operation(self, stack: StackSummary, operation: str) -> dict[str, Any]:
+        def fetch() -> dict[str, Any]:
+            if get_current_worker().is_cancelled:
+                raise CancelledError()
+            return getattr(self._client, operation)(StackName=stack.stack_id)
+
+        return self.request_once(stack, operation, fetch)
+
+    @work(exclusive=True, thread=True, group="describe-stacks")
+    def describe_stacks(self, stack: StackSummary) -> None:
         try:
-            response = self._client.describe_stacks(StackName=stack_id)
-            return response
+            response = self.call_stack_operation(stack, "describe_stacks")
+        except CancelledError:
+            return
         except Exception:
             self.notify("Can't get stack information", severity="error")
-            return {}
+            return
+        self.store_stack_detail(stack, "description", response, self.update_stack_description)
+
+    @work(exclusive=True, thread=True, group="list-stack-resources")
+    def list_stack_resources(self, stack: StackSummary) -> None:
+        worker = get_current_worker()
+
+        def fetch() -> dict[str, Any]:
+            summaries: list[dict[str, Any]] = []
+            paginator = self._client.get_paginator("list_stack_resources")
+            for page in paginator.paginate(StackName=stack.stack_id):
+                if worker.is_cancelled:
+                    raise CancelledError()
+                summaries.extend(page.get("StackResourceSummaries", []))
+                self.app.call_from_thread(self.resources_progress.update, f"Fetched {len(summaries):,} resources...")
+            return {"StackResourceSummaries": summaries}
 
-    @work(exclusive=True, thread=True)
-    def list_stack_resources(self, stack_id: str) -> dict[str, Any]:
         try:
-            response = self._client.list_stack_resources(StackName=stack_id)
-            return response
+            response = self.request_once(stack, "list_stack_resources", fetch)
+        except CancelledError:
+            return
         except Exception:
             self.notify("Can't get stack resource list", severity="error")
-            return {}
-
-    def update_option_list(self, stack_summaries: dict[str, Any]) -> None:
-        self._option_list.clear_options()
-        options = []
-        for idx, stack_summary in enumerate(stack_summaries):
-            if stack_summary.get("StackStatus") == "DELETE_COMPLETE":
-                continue
-            if idx > 0:
-                options.append(Separator())
-            options.append(StackOption(stack_summary))
-
-        self._option_list.add_options(options)
-
-    @on(OptionList.OptionSelected)
-    async def handle_selected_stack(self, message: OptionList.OptionSelected) -> None:
-        if not isinstance(message.option, StackOption):
             return
-        stack_desc = await self.describe_stacks(message.option.stack_id).wait()
-        stack_resources = await self.list_stack_resources(message.option.stack_id).wait()
-        self.update_stack_details(stack_desc, stack_resources)
+        self.store_stack_detail(stack, "resources", response, self.update_stack_resources)
+
+    @work(exclusive=True, thread=True, group="describe-stack-events")
+    def describe_stack_events(self, stack: StackSummary) -> None:
+        try:
+            response = self.call_stack_operation(stack, "describe_stack_events")
+        except CancelledError:
+            return
+        except Exception:
+            self.notify("Can't get stack events", severity="error")
+            return
+        self.store_stack_detail(stack, "events", response, self.update_stack_events)
+
+    @work(exclusive=True, thread=True, group="get-template")
+    def get_template(self, stack: StackSummary) -> None:
+        try:
+            response = self.call_stack_operation(stack, "get_template")
+        except CancelledError:
+            return
+        except Exception:
+            self.notify("Can't get stack template", severity="error")
+            return
+        template_body = response.get("TemplateBody", "")
+        if not isinstance(template_body, str):
+            template_body = json.dumps(template_body, indent=2, default=str)
+        template_cache.set(
+            stack.cache_key, template_body, ttl=IN_PROGRESS_STACK_DETAILS_TTL if stack.in_progress else None
+        )
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self.update_stack_template, template_body)
+
+    def store_stack_detail(
+        self, stack: StackSummary, part: str, response: dict[str, Any], render: Callable[[dict[str, Any]], None]
+    ) -> None:
+        ttl = IN_PROGRESS_STACK_DETAILS_TTL if stack.in_progress else None
+        stack_details_cache.merge(stack.cache_key, {part: response}, ttl=ttl)
+        self.index_stack_detail(stack, part, response)
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(render, response)
 
-    def update_stack_details(self, stacks_description: dict[str, Any], stack_resources: dict[str, Any]) -> None:
+    def index_stacks(self, stack_summaries: list[dict[str, Any]], replace: bool = True) -> None:
+        entities = (
+            Entity(
+                "stack",
+                summary.get("StackName", ""),
+                self._service_path,
+                summary.get("StackId"),
+                summary.get("StackName", ""),
+            )
+            for summary in stack_summaries
+        )
+        if replace:
+            entity_index.update((self._service_path.id, "stacks"), entities)
+        else:
+            entity_index.extend((self._service_path.id, "stacks"), entities)
+
+    def index_stack_detail(self, stack: StackSummary, part: str, response: dict[str, Any]) -> None:
+        """Add the outputs or resources of a stack to the entity index, replacing any indexed before."""
+        if part == "description":
+            entities = (
+                Entity(
+                    "output",
+                    output.get("OutputKey", ""),
+                    self._service_path,
+                    stack.stack_id,
+                    stack.stack_name,
+                    (str(output.get("OutputValue", "")), output.get("ExportName", "")),
+                )
+                for description in response.get("Stacks", [])[:1]
+                for output in description.get("Outputs", [])
+            )
+        elif part == "resources":
+            entities = (
+                Entity(
+                    "resource",
+                    resource.get("LogicalResourceId", ""),
+                    self._service_path,
+                    stack.stack_id,
+                    stack.stack_name,
+                    (resource.get("PhysicalResourceId", ""),),
+                )
+                for resource in response.get("StackResourceSummaries", [])
+            )
+        else:
+            return
+        entity_index.update((self._service_path.id, stack.stack_id, part), entities)
+
+    @on(StackList.Selected)
+    def handle_selected_stack(self, message: StackList.Selected) -> None:
+        # Work for the previously selected stack is dropped, even for parts that the new stack has cached.
+        for group in STACK_DETAIL_GROUPS:
+            self.workers.cancel_group(self, group)
+        if self._stack_details_timer is not None:
+            self._stack_details_timer.stop()
+        stack = message.stack
+        self._selected_stack = stack
+        self.events_view.set_stack(stack)
+        cached = stack_details_cache.get(stack.cache_key)
+        cached_template = template_cache.get(stack.cache_key)
+        self.log.debug("Stack details cache", stack_details_cache.stats)
+        self.update_stack_details(cached.value if cached else {})
+        self.update_stack_template(cached_template.value if cached_template else "")
+        missing_parts = [
+            part
+            for part in ["description", "resources", "events"]
+            if cached is None or part not in cached.value or not cached.part_fresh(part)
+        ]
+        if cached_template is None or not cached_template.fresh:
+            missing_parts.append("template")
+        if missing_parts:
+            # Holding a key down selects a stack on every repeat, so only the one the user settles on is fetched.
+            self._stack_details_timer = self.set_timer(
+                STACK_SELECTION_DEBOUNCE_SECONDS, partial(self.fetch_stack_details, stack, missing_parts)
+            )
+
+    def fetch_stack_details(self, stack: StackSummary, parts: list[str]) -> None:
+        self._stack_details_timer = None
+        fetchers = {
+            "description": self.describe_stacks,
+            "resources": self.list_stack_resources,
+            "events": self.describe_stack_events,
+            "template": self.get_template,
+        }
+        for part in parts:
+            fetchers[part](stack)
+
+    def update_stack_details(self, stack_details: dict[str, Any]) -> None:
+        self.update_stack_description(stack_details.get("description", {}))
+        self.update_stack_resources(stack_details.get("resources", {}))
+        self.update_stack_events(stack_details.get("events", {}))
+
+    def update_stack_description(self, stacks_description: dict[str, Any]) -> None:
         self.properties_table.clear()
         self.parameters_table.clear()
         self.outputs_table.clear()
         self.tags_table.clear()
-        self.resources_table.clear()
-
+        self.response_tree.set_document(stacks_description)
         stacks = stacks_description.get("Stacks")
         if not stacks:
             return
@@ -214,7 +496,28 @@ class CloudFormation(Static):
         for tag in stack.get("Tags", []):
             self.tags_table.add_row(*(tag.get(field, "") for field in fields))
 
+    def update_stack_resources(self, stack_resources: dict[str, Any]) -> None:
+        self.resources_table.clear()
+        self.resources_progress.update("")
+        resources = stack_resources.get("StackResourceSummaries", [])
+        self.add_resource_rows(resources)
+
+    @work(exclusive=True, group="stack-resources-rows")
+    async def add_resource_rows(self, resources: list[dict[str, Any]]) -> None:
+        """Add resource rows in chunks, yielding to the event loop in between so large stacks don't block the UI."""
         fields = ["LogicalResourceId", "PhysicalResourceId", "ResourceType", "ResourceStatus"]
-        for resource in stack_resources.get("StackResourceSummaries", []):
-            self.resources_table.add_row(*(resource.get(field, "") for field in fields))
-        self.query_one(Pretty).update(stacks_description)
+        total = len(resources)
+        for start in range(0, total, RESOURCE_ROWS_CHUNK_SIZE):
+            loaded = min(start + RESOURCE_ROWS_CHUNK_SIZE, total)
+            chunk = resources[start:loaded]
+            self.resources_table.add_rows([resource.get(field, "") for field in fields] for resource in chunk)
+            self.resources_progress.update(
+                f"{loaded:,} of {total:,} resources" if loaded < total else f"{total:,} resources"
+            )
+            await asyncio.sleep(0)
+
+    def update_stack_events(self, stack_events: dict[str, Any]) -> None:
+        self.events_view.show_first_page(stack_events)
+
+    def update_stack_template(self, template_body: str) -> None:
+        self.template_view.update(template_body)
@@ -0,0 +1,194 @@
+from typing import Any
+
+from textual import on, work
+from textual.app import ComposeResult
+from textual.containers import Horizontal, Vertical
+from textual.message import Message
+from textual.widgets import Button, DataTable, Label, SelectionList, Static
+from textual.widgets.data_table import ColumnKey
+from textual.worker import get_current_worker
+
+from ..models import ServicePath, StackSummary
+from ..services import StackFanOut, client_pool, region_catalogue
+from .cloudformation import STACK_STATUS_FILTER
+
+
+class GlobalStacks(Static):
+    """Stacks of several profiles and regions in one table, listed concurrently and merged as pages arrive."""
+
+    DEFAULT_CSS = """
+        .global-stacks-filters {
+            width: 40;
+        }
+
+        .global-stacks-filters > SelectionList {
+            height: 1fr;
+            border: round rgb(255,255,255) 30%;
+            background: $panel;
+        }
+
+        .global-stacks-filters > SelectionList:focus {
+            border: round $secondary 60%;
+        }
+
+        .global-stacks-filters > Button {
+            width: 100%;
+        }
+
+        .global-stacks-results {
+            width: 1fr;
+            border: round rgb(255,255,255) 30%;
+        }
+
+        #global-stacks-table {
+            height: 1fr;
+        }
+
+        #global-stacks-status {
+            color: $text 40%;
+            width: 100%;
+            padding: 0 1;
+        }
+    """
+
+    COLUMNS = [
+        ("Stack", "stack"),
+        ("Status", "status"),
+        ("Account", "account"),
+        ("Region", "region"),
+        ("Profile", "profile"),
+        ("Last Updated", "updated"),
+    ]
+
+    class OpenStack(Message):
+        def __init__(self, service_path: ServicePath, stack_id: str) -> None:
+            self.service_path = service_path
+            self.stack_id = stack_id
+            super().__init__()
+
+    def __init__(self, service_path: ServicePath | None = None, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._initial_service_path = service_path or ServicePath()
+        self._fan_out = StackFanOut()
+        self._stack_paths: dict[str, ServicePath] = {}
+        self._sort_column: ColumnKey | None = None
+        self._sort_reverse = False
+        self._pending = 0
+        self._failed: list[ServicePath] = []
+
+    def compose(self) -> ComposeResult:
+        with Horizontal():
+            with Vertical(classes="global-stacks-filters"):
+                self.profile_selection = SelectionList[str](id="global-stacks-profiles")
+                self.profile_selection.border_title = "Profiles"
+                yield self.profile_selection
+                self.region_selection = SelectionList[str](
+                    *(
+                        (region.title, region.region_name, region.region_name == self._initial_service_path.region_name)
+                        for region in region_catalogue.regions()
+                    ),
+                    id="global-stacks-regions",
+                )
+                self.region_selection.border_title = "Regions"
+                yield self.region_selection
+                yield Button("List stacks", id="global-stacks-list")
+            with Vertical(classes="global-stacks-results"):
+                self.table = DataTable(id="global-stacks-table", cursor_type="row")
+                for label, key in self.COLUMNS:
+                    self.table.add_column(label, key=key)
+                yield self.table
+                self.status = Label("Select profiles and regions, then list their stacks.", id="global-stacks-status")
+                yield self.status
+
+    def on_mount(self) -> None:
+        self.profile_selection.add_options(
+            (profile, profile, profile == self._initial_service_path.profile_name)
+            for profile in client_pool.available_profiles()
+        )
+
+    @on(Button.Pressed, "#global-stacks-list")
+    def handle_list_pressed(self) -> None:
+        service_paths = [
+            ServicePath(profile_name=profile, region_name=region, service_name="cloudformation")
+            for profile in self.profile_selection.selected
+            for region in self.region_selection.selected
+        ]
+        if not service_paths:
+            self.notify("Select at least one profile and one region.")
+            return
+        self.table.clear()
+        self._stack_paths.clear()
+        self._pending = len(service_paths)
+        self._failed = []
+        self.update_status()
+        self.list_stacks(service_paths)
+
+    @work(exclusive=True, thread=True, group="global-list-stacks")
+    def list_stacks(self, service_paths: list[ServicePath]) -> None:
+        worker = get_current_worker()
+
+        def on_stacks(service_path: ServicePath, stack_summaries: list[dict[str, Any]]) -> None:
+            if not worker.is_cancelled:
+                self.app.call_from_thread(self.add_stacks, service_path, stack_summaries)
+
+        def on_finished(service_path: ServicePath, error: BaseException | None) -> None:
+            if not worker.is_cancelled:
+                self.app.call_from_thread(self.finish_service_path, service_path, error)
+
+        self._fan_out.list_stacks(
+            service_paths, STACK_STATUS_FILTER, on_stacks, on_finished, lambda: worker.is_cancelled
+        )
+
+    def add_stacks(self, service_path: ServicePath, stack_summaries: list[dict[str, Any]]) -> None:
+        for stack_summary in stack_summaries:
+            stack = StackSummary.from_response(stack_summary)
+            # The same account can be reachable through several profiles; its stacks are only listed once.
+            if not stack.stack_id or stack.stack_id in self._stack_paths:
+                continue
+            self._stack_paths[stack.stack_id] = service_path
+            account = stack.stack_id.split(":")[4] if stack.stack_id.count(":") >= 5 else ""
+            self.table.add_row(
+                stack.stack_name,
+                stack.stack_status,
+                account,
+                service_path.region_name,
+                service_path.profile_name,
+                stack.last_updated_time,
+                key=stack.stack_id,
+            )
+        if self._sort_column is not None:
+            self.table.sort(self._sort_column, reverse=self._sort_reverse)
+        self.update_status()
+
+    def finish_service_path(self, service_path: ServicePath, error: BaseException | None) -> None:
+        self._pending -= 1
+        if error is not None:
+            self._failed.append(service_path)
+        self.update_status()
+        if self._pending == 0 and self._failed:
+            self.notify(f"Can't list stacks in {len(self._failed)} profile/region pairs.", severity="warning")
+
+    def update_status(self) -> None:
+        status = f"{len(self._stack_paths):,} stacks"
+        if self._pending:
+            status += f", waiting for {self._pending} profile/region pairs"
+        if self._failed:
+            failed = ", ".join(f"{path.profile_name}/{path.region_name}" for path in self._failed)
+            status += f", failed: {failed}"
+        self.status.update(status)
+
+    @on(DataTable.HeaderSelected, "#global-stacks-table")
+    def handle_header_selected(self, message: DataTable.HeaderSelected) -> None:
+        if self._sort_column == message.column_key:
+            self._sort_reverse = not self._sort_reverse
+        else:
+            self._sort_column = message.column_key
+            self._sort_reverse = False
+        self.table.sort(self._sort_column, reverse=self._sort_reverse)
+
+    @on(DataTable.RowSelected, "#global-stacks-table")
+    def handle_row_selected(self, message: DataTable.RowSelected) -> None:
+        stack_id = message.row_key.value
+        service_path = self._stack_paths.get(stack_id or "")
+        if stack_id and service_path is not None:
+            self.post_message(self.OpenStack(service_path.clone(), stack_id))
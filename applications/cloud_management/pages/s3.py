@@ -0,0 +1,226 @@
+from dataclasses import dataclass
+from typing import Any
+
+from rich.text import Text
+from textual import on, work
+from textual.app import ComposeResult
+from textual.containers import Horizontal, Vertical
+from textual.widgets import Label, OptionList, Static, Tree
+from textual.widgets.option_list import Option
+from textual.widgets.tree import TreeNode
+from textual.worker import get_current_worker
+
+from ..models import ServicePath
+from ..services import client_pool, is_throttling_error
+
+OBJECTS_PAGE_SIZE = 1000
+# Entries kept under one prefix; loading past this drops the oldest ones from the top.
+MAX_LOADED_ENTRIES = 10 * OBJECTS_PAGE_SIZE
+
+
+def format_size(size: int) -> str:
+    for unit in ["B", "KiB", "MiB", "GiB", "TiB"]:
+        if size < 1024 or unit == "TiB":
+            return f"{size:,.0f} {unit}" if unit == "B" else f"{size:,.1f} {unit}"
+        size /= 1024
+    return ""
+
+
+@dataclass
+class S3NodeData:
+    kind: str
+    prefix: str = ""
+    continuation_token: str | None = None
+    loaded: bool = False
+    dropped: int = 0
+
+
+class S3(Static):
+    """Buckets and a tree of their prefixes, listed one level and one page at a time.
+
+    A prefix is only listed when it is expanded, a page at a time with a node to load the next one. Each prefix keeps
+    a bounded window of entries and drops them all when collapsed, so memory follows what is open rather than the
+    size of the bucket.
+    """
+
+    DEFAULT_CSS = """
+        .bucket-list-container {
+            border: round rgb(255,255,255) 30%;
+            width: 1fr;
+        }
+
+        .bucket-list-container > OptionList {
+            height: 1fr;
+            border: none;
+            background: $panel;
+        }
+
+        .objects-container {
+            border: round rgb(255,255,255) 30%;
+            width: 3fr;
+        }
+
+        #objects-tree {
+            height: 1fr;
+            background: $panel;
+        }
+
+        #objects-status {
+            color: $text 40%;
+            width: 100%;
+            content-align: right middle;
+            padding: 0 1;
+        }
+    """
+
+    def __init__(self, service_path: ServicePath, **kwargs) -> None:
+        super().__init__(**kwargs)
+        if not service_path.completed or service_path.service_name != "s3":
+            raise ValueError("Invalid service path len")
+        self._service_path = service_path
+        self._client = client_pool.client(service_path)
+        self._bucket: str | None = None
+
+    def compose(self) -> ComposeResult:
+        with Horizontal():
+            with Vertical(classes="bucket-list-container"):
+                self.bucket_list = OptionList(id="bucket-list")
+                yield self.bucket_list
+            with Vertical(classes="objects-container"):
+                self.objects_tree: Tree[S3NodeData] = Tree("Select a bucket", id="objects-tree")
+                yield self.objects_tree
+                self.objects_status = Label("", id="objects-status")
+                yield self.objects_status
+
+    def on_mount(self) -> None:
+        self.list_buckets()
+
+    @work(exclusive=True, thread=True, group="list-buckets")
+    def list_buckets(self) -> None:
+        worker = get_current_worker()
+        try:
+            if self._client.can_paginate("list_buckets"):
+                pages = self._client.get_paginator("list_buckets").paginate()
+            else:
+                pages = [self._client.list_buckets()]
+            for page in pages:
+                if worker.is_cancelled:
+                    return
+                self.app.call_from_thread(self.add_buckets, [bucket["Name"] for bucket in page.get("Buckets", [])])
+        except Exception as error:
+            if is_throttling_error(error):
+                self.notify("AWS is throttling requests, can't get list of buckets.", severity="error")
+            else:
+                self.notify("Can't get list of buckets.", severity="error")
+
+    def add_buckets(self, bucket_names: list[str]) -> None:
+        self.bucket_list.add_options([Option(name, id=name) for name in bucket_names])
+
+    @on(OptionList.OptionSelected, "#bucket-list")
+    def handle_bucket_selected(self, message: OptionList.OptionSelected) -> None:
+        self.show_bucket(message.option.id)
+
+    def show_bucket(self, bucket: str) -> None:
+        self.workers.cancel_group(self, "list-objects")
+        self._bucket = bucket
+        self.objects_tree.reset(bucket, S3NodeData("prefix"))
+        self.objects_tree.root.expand()
+        self.objects_status.update("")
+
+    @on(Tree.NodeExpanded, "#objects-tree")
+    def handle_node_expanded(self, message: Tree.NodeExpanded[S3NodeData]) -> None:
+        data = message.node.data
+        if data is None or data.kind != "prefix" or data.loaded:
+            return
+        data.loaded = True
+        loading = message.node.add_leaf(Text("Loading…", style="dim"), data=S3NodeData("loading"))
+        self.list_objects(message.node, loading, data.prefix, None)
+
+    @on(Tree.NodeCollapsed, "#objects-tree")
+    def handle_node_collapsed(self, message: Tree.NodeCollapsed[S3NodeData]) -> None:
+        # Collapsed prefixes are listed again when reopened rather than kept in memory.
+        data = message.node.data
+        if data is not None and data.kind == "prefix" and message.node is not self.objects_tree.root:
+            data.loaded = False
+            data.dropped = 0
+            self.remove_first_children(message.node, len(message.node.children))
+
+    @on(Tree.NodeSelected, "#objects-tree")
+    def handle_node_selected(self, message: Tree.NodeSelected[S3NodeData]) -> None:
+        node = message.node
+        data = node.data
+        if data is None or data.kind != "more" or node.parent is None or node.parent.data is None:
+            return
+        data.kind = "loading"
+        node.set_label(Text("Loading…", style="dim"))
+        self.list_objects(node.parent, node, node.parent.data.prefix, data.continuation_token)
+
+    @work(thread=True, group="list-objects")
+    def list_objects(
+        self, node: TreeNode[S3NodeData], placeholder: TreeNode[S3NodeData], prefix: str, token: str | None
+    ) -> None:
+        bucket = self._bucket
+        parameters = {"Bucket": bucket, "Prefix": prefix, "Delimiter": "/", "MaxKeys": OBJECTS_PAGE_SIZE}
+        if token is not None:
+            parameters["ContinuationToken"] = token
+        try:
+            response = self._client.list_objects_v2(**parameters)
+        except Exception as error:
+            if not get_current_worker().is_cancelled:
+                self.app.call_from_thread(self.handle_list_objects_error, placeholder, error)
+            return
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self.add_objects, bucket, node, placeholder, response)
+
+    def add_objects(
+        self, bucket: str, node: TreeNode[S3NodeData], placeholder: TreeNode[S3NodeData], response: dict[str, Any]
+    ) -> None:
+        # The prefix may have been collapsed, or another bucket opened, while the page was on its way.
+        if bucket != self._bucket or not self.is_in_tree(placeholder) or placeholder.parent is not node:
+            return
+        placeholder.remove()
+        data = node.data or S3NodeData("prefix")
+        for common_prefix in response.get("CommonPrefixes", []):
+            child_prefix = common_prefix.get("Prefix", "")
+            node.add(
+                Text(child_prefix.removeprefix(data.prefix), style="bold"), data=S3NodeData("prefix", child_prefix)
+            )
+        for item in response.get("Contents", []):
+            key = item.get("Key", "")
+            if key == data.prefix:
+                continue
+            label = Text(key.removeprefix(data.prefix))
+            label.append(f"  {format_size(item.get('Size', 0))}  {item.get('LastModified', '')}", style="dim")
+            node.add_leaf(label, data=S3NodeData("object", key))
+        excess = len(node.children) - MAX_LOADED_ENTRIES
+        if excess > 0:
+            self.remove_first_children(node, excess)
+            data.dropped += excess
+        if response.get("IsTruncated"):
+            node.add_leaf(
+                Text(f"Load {OBJECTS_PAGE_SIZE:,} more…", style="italic"),
+                data=S3NodeData("more", data.prefix, response.get("NextContinuationToken")),
+            )
+        loaded = len(node.children) - bool(response.get("IsTruncated"))
+        shown = f"entries {data.dropped + 1:,}–{data.dropped + loaded:,}" if data.dropped else f"{loaded:,} entries"
+        self.objects_status.update(f"{shown} under s3://{bucket}/{data.prefix}")
+
+    def is_in_tree(self, node: TreeNode[S3NodeData]) -> bool:
+        try:
+            return self.objects_tree.get_node_by_id(node.id) is node
+        except Tree.UnknownNodeID:
+            return False
+
+    @staticmethod
+    def remove_first_children(node: TreeNode[S3NodeData], count: int) -> None:
+        # Front to back: Tree removes children back to front, looking each one up from the front of the list.
+        for child in list(node.children[:count]):
+            child.remove()
+
+    def handle_list_objects_error(self, placeholder: TreeNode[S3NodeData], error: Exception) -> None:
+        if self.is_in_tree(placeholder):
+            placeholder.remove()
+        if is_throttling_error(error):
+            self.notify("AWS is throttling requests, can't list objects.", severity="error")
+        else:
+            self.notify(f"Can't list objects: {error}", severity="error")
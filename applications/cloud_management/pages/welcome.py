@@ -1,15 +1,15 @@
-import boto3
-from botocore.exceptions import BotoCoreError
 from rich.console import RenderableType
-from textual import on
+from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import Center, Horizontal
 from textual.message import Message
 from textual.widgets import Static
+from textual.worker import get_current_worker
 
 from ..components import Logo, SearchableList
 from ..models import ServicePath
-from ..strings import AWS_REGION_MAP, AWS_SERVICE_MAP
+from ..services import ProfileIdentity, ProfileVerifier, client_pool, region_catalogue
+from ..strings import AWS_SERVICE_MAP
 
 WELCOME_DEFAULT_CSS = """
     .main-screen-container {
@@ -73,6 +73,11 @@ class Welcome(Static):
         def control(self) -> "SearchableList":
             return self.list
 
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._profile_verifier = ProfileVerifier()
+        self._unverified_profiles: list[str] = []
+
     def compose(self) -> ComposeResult:
         with Center(classes="main-screen-container"):
             yield Logo()
@@ -99,34 +104,59 @@ class Welcome(Static):
 
     def get_available_regions(self) -> list[SearchableList.ItemDatum]:
         return [
-            SearchableList.ItemDatum(title=f"{region} ({data.get('name')})", id=region)
-            for region, data in AWS_REGION_MAP.items()
+            SearchableList.ItemDatum(title=region.title, id=region.region_name) for region in region_catalogue.regions()
         ]
 
     def get_available_profiles(self) -> list[SearchableList.ItemDatum]:
-        session = boto3.Session()
-        profiles = session.available_profiles
+        profiles = client_pool.available_profiles()
         items = []
+        unverified_profiles = []
         for profile in profiles:
-            disabled = False
-            response = {}
-            if self.VERIFY_PROFILES:
-                session = boto3.Session(profile_name=profile)
-                try:
-                    sts = session.client("sts")
-                    response = sts.get_caller_identity()
-                except BotoCoreError:
-                    disabled = True
-            items.append(SearchableList.ItemDatum(title=profile, id=profile, disabled=disabled, user_data=response))
+            cached = self._profile_verifier.cached(profile) if self.VERIFY_PROFILES else None
+            if cached is not None:
+                items.append(self.create_profile_item(cached))
+            else:
+                items.append(SearchableList.ItemDatum(title=profile, id=profile, user_data={}))
+                unverified_profiles.append(profile)
+        self._unverified_profiles = unverified_profiles if self.VERIFY_PROFILES else []
 
         return items
 
+    @on(SearchableList.Loaded, "#profile-list")
+    def handle_profile_list_loaded(self) -> None:
+        if self._unverified_profiles:
+            self.verify_profiles(self._unverified_profiles)
+
+    @work(exclusive=True, thread=True, group="verify-profiles")
+    def verify_profiles(self, profiles: list[str]) -> None:
+        worker = get_current_worker()
+        profile_list = self.query_one("#profile-list", SearchableList)
+
+        def update_profile_item(profile_identity: ProfileIdentity) -> None:
+            self.app.call_from_thread(profile_list.update_item, self.create_profile_item(profile_identity))
+
+        self._profile_verifier.verify(profiles, update_profile_item, lambda: worker.is_cancelled)
+
+    def create_profile_item(self, profile_identity: ProfileIdentity) -> SearchableList.ItemDatum:
+        return SearchableList.ItemDatum(
+            title=profile_identity.profile_name,
+            id=profile_identity.profile_name,
+            disabled=profile_identity.verified and not profile_identity.valid,
+            user_data=profile_identity.identity,
+            tooltip=(
+                profile_identity.identity.get("Arn") if profile_identity.verified else "Couldn't verify this profile"
+            ),
+        )
+
     def get_available_services(self) -> list[SearchableList.ItemDatum]:
         return [
             SearchableList.ItemDatum(title=data.get("name", service), id=service, user_data=data)
             for service, data in AWS_SERVICE_MAP.items()
         ]
 
+    def select_region(self, region_name: str) -> None:
+        self.query_one("#region-list", SearchableList).select_item(region_name)
+
     @on(SearchableList.Selected)
     def handle_list_item_selected(self, message: SearchableList.Selected) -> None:
         list_id = message.control.id
@@ -1,5 +1,6 @@
 from .main import MainScreen
+from .metrics import MetricsScreen
 from .profile import ProfileScreen
 from .standalone import StandaloneScreen
 
-__all__ = ["ProfileScreen", "MainScreen", "StandaloneScreen"]
+__all__ = ["ProfileScreen", "MainScreen", "MetricsScreen", "StandaloneScreen"]
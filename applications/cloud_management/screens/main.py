@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 from textual import on
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -5,9 +7,11 @@ from textual.css.query import NoMatches
 from textual.screen import Screen
 from textual.widgets import ContentSwitcher, Header, TabbedContent, TabPane
 
+from ..commands import EntityCommands, RegionCommands
 from ..components import Footer
-from ..models import ServicePath
-from ..pages import CloudFormation, Welcome
+from ..models import CloudFormationSnapshot, ServicePath
+from ..pages import S3, CloudFormation, GlobalStacks, Welcome
+from ..services import current_rss_bytes
 from ..strings import AWS_SERVICE_MAP
 
 
@@ -19,10 +23,34 @@ class MainScreen(Screen):
     """
     BINDINGS = [
         Binding("ctrl+g", "open_service", "Open Service", show=True),
+        Binding("ctrl+l", "open_global_stacks", "All Stacks", show=True),
     ]
 
-    SERVICE_PAGE_MAP = {"cloudformation": CloudFormation}
+    COMMANDS = {EntityCommands, RegionCommands}
+
+    SERVICE_PAGE_MAP = {"cloudformation": CloudFormation, "s3": S3}
+    # The stack tab that shows each kind of indexed entity.
+    ENTITY_TABS = {"resource": "resources", "output": "outputs"}
     WELCOME_PAGE_ID = "welcome"
+    GLOBAL_STACKS_PAGE_ID = "global-stacks"
+    DEFAULT_MAX_MOUNTED_PAGES = 4
+    DEFAULT_MAX_MEMORY_MB = 512
+
+    def __init__(
+        self,
+        max_mounted_pages: int = DEFAULT_MAX_MOUNTED_PAGES,
+        max_memory_mb: int | None = DEFAULT_MAX_MEMORY_MB,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+    ) -> None:
+        super().__init__(name, id, classes)
+        self._max_mounted_pages = max_mounted_pages
+        self._max_memory_mb = max_memory_mb
+        # Panes whose page can be suspended and is mounted, least recently used first, and snapshots of the suspended
+        # ones. Other panes, e.g. the welcome page, stay mounted and don't count towards `max_mounted_pages`.
+        self._mounted_panes: OrderedDict[str, None] = OrderedDict()
+        self._snapshots: dict[str, CloudFormationSnapshot] = {}
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -47,6 +75,9 @@ class MainScreen(Screen):
         if not active_tab_service_path:
             return
         self.set_footer_service_path(active_tab_service_path)
+        if message.tab.id in self._snapshots:
+            self.resume_service_pane(message.tab.id)
+        self.touch_service_pane(message.tab.id)
 
     def action_open_service(self) -> None:
         service_path = self._service_path_index.get(self.WELCOME_PAGE_ID)
@@ -55,6 +86,35 @@ class MainScreen(Screen):
             return
         _ = self.get_or_create_service_pane(service_path)
 
+    def action_open_global_stacks(self) -> None:
+        try:
+            self._content_switcher.get_child_by_id(self.GLOBAL_STACKS_PAGE_ID, TabPane)
+        except NoMatches:
+            service_path = self._service_path_index.get(self.WELCOME_PAGE_ID)
+            global_stacks = GlobalStacks(service_path.clone() if service_path else None)
+            self.tabbed_content.add_pane(TabPane("All Stacks", global_stacks, id=self.GLOBAL_STACKS_PAGE_ID))
+        self.tabbed_content.active = self.GLOBAL_STACKS_PAGE_ID
+
+    @on(GlobalStacks.OpenStack)
+    def handle_open_stack(self, message: GlobalStacks.OpenStack) -> None:
+        service_pane = self.get_or_create_service_pane(message.service_path)
+        if service_pane is not None:
+            service_pane.query_one(CloudFormation).show_stack(message.stack_id)
+
+    @on(EntityCommands.Selected)
+    def handle_entity_selected(self, message: EntityCommands.Selected) -> None:
+        entity = message.entity
+        service_pane = self.get_or_create_service_pane(entity.service_path.clone())
+        if service_pane is not None and entity.stack_id is not None:
+            service_pane.query_one(CloudFormation).show_stack(entity.stack_id, self.ENTITY_TABS.get(entity.kind))
+
+    @on(RegionCommands.Selected)
+    def handle_region_selected(self, message: RegionCommands.Selected) -> None:
+        # The welcome page reports the whole service path once it is complete; until then only the region is shown.
+        self.query_one(Welcome).select_region(message.region_name)
+        self._footer.session.region_name = message.region_name
+        self.tabbed_content.active = self.WELCOME_PAGE_ID
+
     def get_or_create_service_pane(self, service_path: ServicePath) -> TabPane | None:
         try:
             service_pane = self._content_switcher.get_child_by_id(service_path.id, TabPane)
@@ -67,11 +127,62 @@ class MainScreen(Screen):
             self._service_path_index[service_path.id] = service_path.clone()
             service_pane = TabPane(service_title, service_page(service_path), id=service_path.id)
             self.tabbed_content.add_pane(service_pane)
+        else:
+            if service_path.id in self._snapshots:
+                self.resume_service_pane(service_path.id)
 
         self.tabbed_content.active = service_path.id
         self.tabbed_content.show_tab(service_path.id)
+        self.touch_service_pane(service_path.id)
         return service_pane
 
+    def touch_service_pane(self, pane_id: str) -> None:
+        if not self.supports_snapshot(pane_id):
+            return
+        self._mounted_panes[pane_id] = None
+        self._mounted_panes.move_to_end(pane_id)
+        self.suspend_idle_service_panes()
+
+    def suspend_idle_service_panes(self) -> None:
+        """Suspend least recently used panes while over the page count, then one more if over the memory budget."""
+        idle_panes = [pane_id for pane_id in self._mounted_panes if pane_id != self.tabbed_content.active]
+        while idle_panes and len(self._mounted_panes) > self._max_mounted_pages:
+            self.suspend_service_pane(idle_panes.pop(0))
+        rss = current_rss_bytes()
+        # Memory is only given back once the page is garbage collected, so one pane is suspended per activation.
+        if idle_panes and rss is not None and self._max_memory_mb and rss > self._max_memory_mb * 1024 * 1024:
+            self.suspend_service_pane(idle_panes.pop(0))
+
+    def supports_snapshot(self, pane_id: str) -> bool:
+        """Whether the pane holds a service page that can be removed and rebuilt later from its `snapshot()`."""
+        service_path = self._service_path_index.get(pane_id)
+        if pane_id == self.WELCOME_PAGE_ID or service_path is None:
+            return False
+        return callable(getattr(self.SERVICE_PAGE_MAP.get(service_path.service_name), "snapshot", None))
+
+    def suspend_service_pane(self, pane_id: str) -> None:
+        self._mounted_panes.pop(pane_id, None)
+        if not self.supports_snapshot(pane_id):
+            return
+        service_page_class = self.SERVICE_PAGE_MAP[self._service_path_index[pane_id].service_name]
+        service_pane = self._content_switcher.get_child_by_id(pane_id, TabPane)
+        try:
+            service_page = service_pane.query_one(service_page_class)
+        except NoMatches:
+            return
+        self._snapshots[pane_id] = service_page.snapshot()
+        service_page.remove()
+
+    def resume_service_pane(self, pane_id: str) -> None:
+        snapshot = self._snapshots.pop(pane_id)
+        service_path = self._service_path_index[pane_id]
+        service_page = self.SERVICE_PAGE_MAP[service_path.service_name]
+        service_pane = self._content_switcher.get_child_by_id(pane_id, TabPane)
+        if self.supports_snapshot(pane_id):
+            service_pane.mount(service_page(service_path, snapshot=snapshot))
+        else:
+            service_pane.mount(service_page(service_path))
+
     def set_footer_service_path(self, service_path: ServicePath) -> None:
         self._footer.session.profile_name = service_path.profile_name
         self._footer.session.region_name = service_path.region_name
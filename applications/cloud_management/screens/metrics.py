@@ -0,0 +1,77 @@
+from typing import Any
+
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.screen import ModalScreen
+from textual.widgets import DataTable, Label
+
+from ..services import LATENCY_BUCKETS_MS, call_metrics, stack_details_cache, template_cache
+
+
+class MetricsScreen(ModalScreen):
+    """Per-operation AWS call metrics, refreshed while the screen is open."""
+
+    DEFAULT_CSS = """
+        MetricsScreen {
+            align: center middle;
+        }
+        MetricsScreen > DataTable {
+            width: 90%;
+            height: 80%;
+            border: round $secondary;
+        }
+        MetricsScreen > Label {
+            width: 90%;
+            color: $text 40%;
+            content-align: right middle;
+            padding: 0 1;
+        }
+    """
+    BINDINGS = [Binding("escape,f2", "dismiss", "Close", show=True)]
+
+    COLUMNS = ["operation", "calls", "errors", "retries", "throttles", "p50 ms", "p95 ms", "max ms", "wait ms", "KiB"]
+    REFRESH_SECONDS = 1
+    CACHES = {"stack details": stack_details_cache, "templates": template_cache}
+
+    def compose(self) -> ComposeResult:
+        self.table = DataTable(cursor_type="row", zebra_stripes=True)
+        self.table.add_columns(*self.COLUMNS)
+        yield self.table
+        yield Label(
+            f"latency buckets: {', '.join(map(str, LATENCY_BUCKETS_MS))} ms; wait is the average before sending"
+        )
+        self.cache_label = Label()
+        yield self.cache_label
+
+    def on_mount(self) -> None:
+        self._version = -1
+        self.refresh_metrics()
+        self.set_interval(self.REFRESH_SECONDS, self.refresh_metrics)
+
+    def refresh_metrics(self) -> None:
+        # Cache lookups don't call AWS, so the cache line is refreshed whether or not the call metrics changed.
+        self.cache_label.update("; ".join(self.cache_summary(name, cache.stats) for name, cache in self.CACHES.items()))
+        if call_metrics.version == self._version:
+            return
+        self._version = call_metrics.version
+        self.table.clear()
+        for operation in sorted(call_metrics.snapshot(), key=lambda operation: -operation.total_ms):
+            self.table.add_row(
+                operation.operation,
+                operation.calls,
+                operation.errors,
+                operation.retries,
+                operation.throttles,
+                f"{operation.percentile(0.5):.0f}",
+                f"{operation.percentile(0.95):.0f}",
+                f"{operation.max_ms:.0f}",
+                f"{operation.average_prepare_ms:.0f}",
+                f"{operation.response_bytes / 1024:.1f}",
+            )
+
+    @staticmethod
+    def cache_summary(name: str, stats: dict[str, Any]) -> str:
+        return (
+            f"{name} cache: {stats['size']} entries, {stats['hits']} hits, {stats['stale_hits']} stale, "
+            f"{stats['misses']} misses, {stats['evictions']} evictions"
+        )
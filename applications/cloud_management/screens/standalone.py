@@ -4,11 +4,11 @@ from textual.widgets import Header
 
 from ..components import Footer
 from ..models import ServicePath
-from ..pages import CloudFormation
+from ..pages import S3, CloudFormation
 
 
 class StandaloneScreen(Screen):
-    SERVICE_PAGE_MAP = {"cloudformation": CloudFormation}
+    SERVICE_PAGE_MAP = {"cloudformation": CloudFormation, "s3": S3}
 
     def __init__(
         self, service_path: ServicePath, name: str | None = None, id: str | None = None, classes: str | None = None
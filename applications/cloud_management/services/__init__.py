@@ -0,0 +1,50 @@
+from .aws_errors import AUTH_ERROR_CODES, REGION_NOT_ENABLED_ERROR_CODES, is_auth_error, is_region_not_enabled_error
+from .cache import LRUCache, stack_details_cache, stack_summaries_cache, template_cache
+from .call_metrics import LATENCY_BUCKETS_MS, CallMetrics, OperationMetrics, call_metrics
+from .client_pool import ClientPool, client_pool
+from .disk_cache import DiskCache
+from .entity_index import EntityIndex, entity_index
+from .memory import current_rss_bytes
+from .profile_verifier import ProfileIdentity, ProfileVerifier
+from .rate_limiter import RateLimiter, TokenBucket, is_throttling_error, rate_limiter
+from .region_catalogue import RegionCatalogue, region_catalogue
+from .single_flight import SingleFlight, single_flight
+from .stack_exporter import StackExporter
+from .stack_fan_out import StackFanOut
+from .startup_trace import StartupTrace
+from .ui_profiler import UIProfiler
+
+__all__ = [
+    "AUTH_ERROR_CODES",
+    "LATENCY_BUCKETS_MS",
+    "CallMetrics",
+    "ClientPool",
+    "DiskCache",
+    "EntityIndex",
+    "LRUCache",
+    "OperationMetrics",
+    "ProfileIdentity",
+    "ProfileVerifier",
+    "REGION_NOT_ENABLED_ERROR_CODES",
+    "RateLimiter",
+    "RegionCatalogue",
+    "SingleFlight",
+    "StackExporter",
+    "StackFanOut",
+    "StartupTrace",
+    "TokenBucket",
+    "UIProfiler",
+    "call_metrics",
+    "client_pool",
+    "current_rss_bytes",
+    "entity_index",
+    "is_auth_error",
+    "is_region_not_enabled_error",
+    "is_throttling_error",
+    "rate_limiter",
+    "region_catalogue",
+    "single_flight",
+    "stack_details_cache",
+    "stack_summaries_cache",
+    "template_cache",
+]
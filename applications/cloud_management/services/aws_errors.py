@@ -0,0 +1,49 @@
+AUTH_ERROR_CODES = {
+    "AccessDenied",
+    "AccessDeniedException",
+    "AuthFailure",
+    "ExpiredToken",
+    "ExpiredTokenException",
+    "InvalidAccessKeyId",
+    "InvalidClientTokenId",
+    "InvalidToken",
+    "MissingAuthenticationToken",
+    "SignatureDoesNotMatch",
+    "UnrecognizedClientException",
+}
+
+# A region that is off for the account mostly rejects its credentials with an auth error code; some services say so.
+REGION_NOT_ENABLED_ERROR_CODES = {
+    "OptInRequired",
+    "RegionDisabledException",
+}
+
+
+def is_auth_error(error: BaseException) -> bool:
+    """Whether `error` means the profile's credentials are missing, expired or rejected, rather than unreachable."""
+    from botocore.exceptions import (
+        CredentialRetrievalError,
+        NoCredentialsError,
+        PartialCredentialsError,
+        ProfileNotFound,
+        SSOError,
+        TokenRetrievalError,
+    )
+
+    credential_errors = (
+        CredentialRetrievalError,
+        NoCredentialsError,
+        PartialCredentialsError,
+        ProfileNotFound,
+        SSOError,
+        TokenRetrievalError,
+    )
+    if isinstance(error, credential_errors):
+        return True
+    response = getattr(error, "response", None) or {}
+    return response.get("Error", {}).get("Code") in AUTH_ERROR_CODES
+
+
+def is_region_not_enabled_error(error: BaseException) -> bool:
+    response = getattr(error, "response", None) or {}
+    return response.get("Error", {}).get("Code") in REGION_NOT_ENABLED_ERROR_CODES
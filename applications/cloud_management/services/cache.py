@@ -0,0 +1,110 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Generic, Hashable, TypeVar
+
+KeyType = TypeVar("KeyType", bound=Hashable)
+ValueType = TypeVar("ValueType")
+
+
+@dataclass
+class CacheEntry(Generic[ValueType]):
+    value: ValueType
+    expires_at: float
+    # For entries built with `LRUCache.merge`: when each part expires. The entry expires with its earliest part.
+    parts_expire_at: dict[Hashable, float] = field(default_factory=dict)
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    def part_fresh(self, part: Hashable) -> bool:
+        return time.monotonic() < self.parts_expire_at.get(part, self.expires_at)
+
+
+class LRUCache(Generic[KeyType, ValueType]):
+    """Thread-safe LRU cache whose entries expire after a per-entry TTL.
+
+    Expired entries are still returned by `get` so callers can render stale data while they refresh it.
+    """
+
+    def __init__(self, max_size: int, default_ttl: float) -> None:
+        self._max_size = max_size
+        self._default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[KeyType, CacheEntry[ValueType]] = OrderedDict()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: KeyType) -> CacheEntry[ValueType] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if entry.fresh:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+            return entry
+
+    def set(self, key: KeyType, value: ValueType, ttl: float | None = None) -> None:
+        with self._lock:
+            self._store(key, CacheEntry(value, self._expires_at(ttl)))
+
+    def merge(self, key: KeyType, values: dict, ttl: float | None = None) -> None:
+        """Add parts to the dict cached under `key`; only the parts added get the new TTL, the others keep theirs."""
+        with self._lock:
+            entry = self._entries.get(key)
+            expires_at = self._expires_at(ttl)
+            if entry is None:
+                merged, parts_expire_at = dict(values), {}
+            else:
+                merged = {**entry.value, **values}
+                parts_expire_at = {part: entry.parts_expire_at.get(part, entry.expires_at) for part in entry.value}
+            parts_expire_at.update(dict.fromkeys(values, expires_at))
+            self._store(key, CacheEntry(merged, min(parts_expire_at.values(), default=expires_at), parts_expire_at))
+
+    def invalidate(self, key: KeyType) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+            }
+
+    def _expires_at(self, ttl: float | None) -> float:
+        return time.monotonic() + (self._default_ttl if ttl is None else ttl)
+
+    def _store(self, key: KeyType, entry: CacheEntry[ValueType]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+stack_details_cache: LRUCache[tuple[str, str], dict[str, Any]] = LRUCache(max_size=256, default_ttl=10 * 60)
+stack_summaries_cache: LRUCache[str, list[dict[str, Any]]] = LRUCache(max_size=32, default_ttl=2 * 60)
+# Keyed like stack details, by StackId and LastUpdatedTime, so a template stays valid until its stack is updated.
+template_cache: LRUCache[tuple[str, str], str] = LRUCache(max_size=16, default_ttl=24 * 60 * 60)
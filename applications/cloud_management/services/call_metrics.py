@@ -0,0 +1,179 @@
+import bisect
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, TextIO
+
+from .rate_limiter import THROTTLING_ERROR_CODES
+
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+
+CONTEXT_STARTED_AT_KEY = "call_metrics_started_at"
+CONTEXT_SENT_AT_KEY = "call_metrics_sent_at"
+CONTEXT_THROTTLES_KEY = "call_metrics_throttles"
+
+# Upper bounds, in milliseconds, of the latency histogram buckets; the last bucket catches everything slower.
+LATENCY_BUCKETS_MS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+
+@dataclass
+class OperationMetrics:
+    operation: str
+    calls: int = 0
+    errors: int = 0
+    retries: int = 0
+    throttles: int = 0
+    response_bytes: int = 0
+    total_ms: float = 0.0
+    prepare_ms: float = 0.0
+    max_ms: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+    def add(
+        self, latency_ms: float, prepare_ms: float, response_bytes: int, retries: int, throttles: int, error: bool
+    ) -> None:
+        self.calls += 1
+        self.errors += error
+        self.retries += retries
+        self.throttles += throttles
+        self.response_bytes += response_bytes
+        self.total_ms += latency_ms
+        self.prepare_ms += prepare_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of calls; the maximum for the last bucket."""
+        rank = fraction * self.calls
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return LATENCY_BUCKETS_MS[index] if index < len(LATENCY_BUCKETS_MS) else self.max_ms
+        return 0.0
+
+    @property
+    def average_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    @property
+    def average_prepare_ms(self) -> float:
+        return self.prepare_ms / self.calls if self.calls else 0.0
+
+
+class CallMetrics:
+    """Per-operation latency histograms, retries, throttles and response sizes of every pooled client's calls.
+
+    Clients are instrumented through botocore events. The time between `before-call` and the first `before-send`
+    covers waiting for the rate limiter, signing and credential refresh, and is kept apart from the total so a slow
+    credential provider isn't mistaken for a slow service.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._operations: dict[str, OperationMetrics] = {}
+        self._local = threading.local()
+        self.version = 0
+
+    def attach(self, client: "BaseClient") -> None:
+        client.meta.events.register("before-call", self._before_call)
+        client.meta.events.register("before-send", self._before_send)
+        client.meta.events.register("needs-retry", self._needs_retry)
+        client.meta.events.register("after-call", self._after_call)
+        client.meta.events.register("after-call-error", self._after_call_error)
+
+    def _before_call(self, context: dict[str, Any], **kwargs) -> None:
+        context[CONTEXT_STARTED_AT_KEY] = time.monotonic()
+        self._local.context = context
+
+    def _before_send(self, **kwargs) -> None:
+        # before-send doesn't get the request context, but it runs on the thread that emitted before-call.
+        context = getattr(self._local, "context", None)
+        if context is not None:
+            context.setdefault(CONTEXT_SENT_AT_KEY, time.monotonic())
+
+    def _needs_retry(
+        self,
+        response: tuple[Any, dict[str, Any]] | None = None,
+        request_dict: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> None:
+        # Counted in the request context and recorded with the call once it finishes, so every operation in the
+        # metrics has at least one call.
+        if response is not None and response[1].get("Error", {}).get("Code") in THROTTLING_ERROR_CODES:
+            context = (request_dict or {}).get("context")
+            if context is not None:
+                context[CONTEXT_THROTTLES_KEY] = context.get(CONTEXT_THROTTLES_KEY, 0) + 1
+
+    def _after_call(
+        self, event_name: str, http_response: Any, parsed: dict[str, Any], context: dict[str, Any], **kwargs
+    ) -> None:
+        # The header rather than the body, which for streaming operations hasn't been read yet.
+        response_bytes = int(getattr(http_response, "headers", {}).get("content-length") or 0)
+        retries = parsed.get("ResponseMetadata", {}).get("RetryAttempts", 0)
+        self._record(event_name, context, response_bytes, retries, error="Error" in parsed)
+
+    def _after_call_error(self, event_name: str, context: dict[str, Any], **kwargs) -> None:
+        self._record(event_name, context, 0, 0, error=True)
+
+    def _record(self, event_name: str, context: dict[str, Any], response_bytes: int, retries: int, error: bool) -> None:
+        now = time.monotonic()
+        started_at = context.get(CONTEXT_STARTED_AT_KEY, now)
+        sent_at = context.get(CONTEXT_SENT_AT_KEY, started_at)
+        throttles = context.get(CONTEXT_THROTTLES_KEY, 0)
+        self._local.context = None
+        with self._lock:
+            self._operation(self._operation_name(event_name)).add(
+                (now - started_at) * 1000, (sent_at - started_at) * 1000, response_bytes, retries, throttles, error
+            )
+            self.version += 1
+
+    @staticmethod
+    def _operation_name(event_name: str) -> str:
+        # Event names look like "after-call.cloudformation.ListStacks".
+        return ".".join(event_name.split(".")[1:3])
+
+    def _operation(self, name: str) -> OperationMetrics:
+        operation = self._operations.get(name)
+        if operation is None:
+            operation = self._operations[name] = OperationMetrics(name)
+        return operation
+
+    def snapshot(self) -> list[OperationMetrics]:
+        with self._lock:
+            return [
+                OperationMetrics(**{**asdict(operation), "buckets": list(operation.buckets)})
+                for operation in self._operations.values()
+            ]
+
+    def summary(self) -> dict[str, Any]:
+        operations = self.snapshot()
+        calls = sum(operation.calls for operation in operations)
+        return {
+            "calls": calls,
+            "errors": sum(operation.errors for operation in operations),
+            "retries": sum(operation.retries for operation in operations),
+            "throttles": sum(operation.throttles for operation in operations),
+            "p95_ms": max((operation.percentile(0.95) for operation in operations), default=0.0),
+        }
+
+    def write_jsonl(self, output: TextIO) -> None:
+        for operation in self.snapshot():
+            record = asdict(operation)
+            record.update(
+                p50_ms=operation.percentile(0.5),
+                p95_ms=operation.percentile(0.95),
+                average_ms=operation.average_ms,
+                bucket_bounds_ms=LATENCY_BUCKETS_MS,
+            )
+            output.write(json.dumps(record) + "\n")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._operations.clear()
+            self.version += 1
+
+
+call_metrics = CallMetrics()
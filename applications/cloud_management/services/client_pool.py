@@ -0,0 +1,154 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable
+
+from ..models import ServicePath
+from .call_metrics import CallMetrics, call_metrics
+from .profiles import read_available_profiles
+from .rate_limiter import RateLimiter, rate_limiter
+
+if TYPE_CHECKING:
+    import boto3
+    from botocore.client import BaseClient
+    from botocore.config import Config
+    from botocore.loaders import Loader
+
+ClientKey = tuple[str | None, str | None, str, "Config | None"]
+
+
+@dataclass
+class PooledClient:
+    client: "BaseClient"
+    last_used: float
+
+
+class ClientPool:
+    """Process-wide cache of boto3 sessions and clients keyed by (profile, region, service).
+
+    One session is kept per profile so its credentials are resolved once, and all sessions share a single botocore
+    data loader so service models are read from disk once. boto3 itself is only imported when the first session is
+    created, so the UI can start without paying for it. Every client is attached to the pool's rate limiter, so tabs
+    that talk to the same account and region share one request budget, and to the pool's call metrics.
+    """
+
+    DEFAULT_MAX_IDLE_SECONDS = 15 * 60
+
+    def __init__(
+        self,
+        max_idle_seconds: float = DEFAULT_MAX_IDLE_SECONDS,
+        rate_limiter: RateLimiter | None = None,
+        call_metrics: CallMetrics | None = None,
+    ) -> None:
+        self._max_idle_seconds = max_idle_seconds
+        self._rate_limiter = rate_limiter
+        self._call_metrics = call_metrics
+        self._lock = threading.RLock()
+        self._loader: "Loader | None" = None
+        self._sessions: dict[str | None, "boto3.Session"] = {}
+        self._clients: dict[ClientKey, PooledClient] = {}
+        self._client_hooks: list[Callable[["BaseClient"], None]] = []
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def session(self, profile_name: str | None = None) -> "boto3.Session":
+        with self._lock:
+            session = self._sessions.get(profile_name)
+            if session is None:
+                session = self._create_session(profile_name)
+                self._sessions[profile_name] = session
+            return session
+
+    def client(self, service_path: ServicePath, config: "Config | None" = None) -> "BaseClient":
+        if not service_path.service_name:
+            raise ValueError("Service path has no service name")
+        key = (service_path.profile_name, service_path.region_name, service_path.service_name, config)
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            pooled = self._clients.get(key)
+            if pooled is not None:
+                self.hits += 1
+                pooled.last_used = now
+                return pooled.client
+            self.misses += 1
+            client = self.session(service_path.profile_name).client(
+                service_path.service_name, region_name=service_path.region_name, config=config
+            )
+            # Metrics are attached first so their latency includes time spent waiting for the rate limiter.
+            if self._call_metrics is not None:
+                self._call_metrics.attach(client)
+            if self._rate_limiter is not None:
+                self._rate_limiter.attach(client, service_path)
+            for hook in self._client_hooks:
+                hook(client)
+            self._clients[key] = PooledClient(client, now)
+            return client
+
+    def add_client_hook(self, hook: Callable[["BaseClient"], None]) -> None:
+        """Call `hook` with every pooled client, e.g. to register botocore event handlers on it."""
+        with self._lock:
+            self._client_hooks.append(hook)
+            for pooled in self._clients.values():
+                hook(pooled.client)
+
+    def remove_client_hook(self, hook: Callable[["BaseClient"], None]) -> None:
+        with self._lock:
+            self._client_hooks.remove(hook)
+
+    def available_profiles(self) -> list[str]:
+        return read_available_profiles()
+
+    def get_available_regions(self, service_name: str) -> list[str]:
+        return self.session().get_available_regions(service_name)
+
+    def preload(self) -> None:
+        """Import the SDK and create the default session, e.g. from a background worker during startup."""
+        self.session()
+
+    def evict_idle(self) -> int:
+        with self._lock:
+            return self._evict_idle(time.monotonic())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+            self._sessions.clear()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "clients": len(self._clients),
+                "sessions": len(self._sessions),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _evict_idle(self, now: float) -> int:
+        expired = [key for key, pooled in self._clients.items() if now - pooled.last_used > self._max_idle_seconds]
+        for key in expired:
+            del self._clients[key]
+        self.evictions += len(expired)
+        return len(expired)
+
+    def _create_session(self, profile_name: str | None) -> "boto3.Session":
+        import boto3
+        from botocore.session import Session as BotocoreSession
+
+        botocore_session = BotocoreSession()
+        if self._loader is None:
+            self._loader = botocore_session.get_component("data_loader")
+        else:
+            botocore_session.register_component("data_loader", self._loader)
+        session = boto3.Session(botocore_session=botocore_session, profile_name=profile_name)
+        # boto3 appends its own data directory to the loader of every new session.
+        self._loader.search_paths[:] = list(dict.fromkeys(self._loader.search_paths))
+        return session
+
+
+client_pool = ClientPool(rate_limiter=rate_limiter, call_metrics=call_metrics)
@@ -0,0 +1,50 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+
+def cache_directory() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "cloud-management"
+
+
+class DiskCache:
+    """A small JSON file of entries with wall-clock expiry, shared between runs of the application."""
+
+    def __init__(self, name: str, directory: Path | None = None) -> None:
+        self._path = (directory or cache_directory()) / f"{name}.json"
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] | None = None
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._load().get(key)
+            if entry is None or entry.get("expires_at", 0) < time.time():
+                return None
+            return entry.get("value")
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._load()[key] = {"value": value, "expires_at": time.time() + ttl}
+
+    def save(self) -> None:
+        with self._lock:
+            entries = {key: entry for key, entry in self._load().items() if entry.get("expires_at", 0) >= time.time()}
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                temporary_path = self._path.with_suffix(".tmp")
+                temporary_path.write_text(json.dumps(entries, default=str))
+                os.replace(temporary_path, self._path)
+            except OSError:
+                pass
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self._path.read_text())
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
@@ -0,0 +1,194 @@
+import bisect
+import itertools
+import threading
+from typing import Hashable, Iterable, Iterator
+
+from ..models import Entity
+from ..models.search_index import camel_case_words, tokenize
+
+# Sorts after any character a token can contain, so `prefix + LAST_CHARACTER` bounds the tokens starting with it.
+LAST_CHARACTER = "\U0010ffff"
+
+
+class EntityIndex:
+    """An inverted index from name tokens to the entities loaded so far, kept up to date as pages load them.
+
+    Entities are added in groups under an owner, e.g. the resources of one stack, and a group is replaced as a whole
+    when it is loaded again. Names are split at separators and, so logical IDs can be searched by any of their
+    words, at CamelCase boundaries too. Every query token has to be a prefix of one of an entity's tokens.
+    Candidates come from the query token that matches the fewest entities and are checked against the others, and
+    the scan stops once enough of them match, so queries stay fast however many entities are indexed.
+    """
+
+    MAX_RESULTS = 20
+    MAX_SCANNED = 1000
+    PREFIX_CHUNK_SIZE = 256
+    # New tokens up to this many are inserted one by one; larger batches are appended and merged with one sort.
+    MAX_INSORTED_TOKENS = 64
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        self._entities: dict[int, Entity] = {}
+        self._entity_tokens: dict[int, frozenset[str]] = {}
+        self._entity_texts: dict[int, str] = {}
+        self._postings: dict[str, set[int]] = {}
+        self._owners: dict[Hashable, list[int]] = {}
+        # Sorted tokens for prefix lookups. Tokens whose last entity is removed stay listed, and are skipped, until
+        # they make up half of the list.
+        self._sorted_tokens: list[str] = []
+        self._listed_tokens: set[str] = set()
+        self._unused_tokens = 0
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def update(self, owner: Hashable, entities: Iterable[Entity]) -> None:
+        """Replace the entities previously added under `owner`."""
+        with self._lock:
+            for entity_id in self._owners.pop(owner, []):
+                self._remove(entity_id)
+            new_tokens: list[str] = []
+            self._owners[owner] = [self._add(entity, new_tokens) for entity in entities]
+            self._list_tokens(new_tokens)
+
+    def extend(self, owner: Hashable, entities: Iterable[Entity]) -> None:
+        """Add entities to those already under `owner`, e.g. a page at a time."""
+        with self._lock:
+            new_tokens: list[str] = []
+            self._owners.setdefault(owner, []).extend(self._add(entity, new_tokens) for entity in entities)
+            self._list_tokens(new_tokens)
+
+    def remove(self, owner: Hashable) -> None:
+        with self._lock:
+            for entity_id in self._owners.pop(owner, []):
+                self._remove(entity_id)
+            self._list_tokens([])
+
+    def search(self, query: str, limit: int = MAX_RESULTS) -> list[tuple[float, Entity]]:
+        """Return up to `limit` matching entities, best first, with scores between 0 and 1."""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+        matches: list[tuple[int, int, int]] = []
+        scanned = 0
+        with self._lock:
+            counts = {token: self._prefix_count(token) for token in tokens}
+            if not all(counts.values()):
+                return []
+            # Candidates come from the token with the fewest postings; the others are checked against each candidate.
+            driver = min(tokens, key=counts.__getitem__)
+            others = [(token, f" {token}") for token in tokens if token != driver]
+            seen: set[int] = set()
+            for token, postings in self._postings_with_prefix(driver):
+                for entity_id in postings:
+                    scanned += 1
+                    if scanned > self.MAX_SCANNED or len(matches) >= limit * 2:
+                        break
+                    if entity_id in seen:
+                        continue
+                    seen.add(entity_id)
+                    score = self._score(self._entity_tokens[entity_id], self._entity_texts[entity_id], others)
+                    if score is not None:
+                        score += 2 if token == driver else 1
+                        matches.append((score, entity_id, len(self._entities[entity_id].name)))
+                else:
+                    continue
+                break
+            matches.sort(key=lambda match: (-match[0], match[2]))
+            return [(score / (2 * len(tokens)), self._entities[entity_id]) for score, entity_id, _ in matches[:limit]]
+
+    def _prefix_range(self, prefix: str) -> tuple[int, int]:
+        """The slice of the sorted tokens that start with `prefix`, including tokens no longer in use."""
+        sorted_tokens = self._sorted_tokens
+        start = bisect.bisect_left(sorted_tokens, prefix)
+        return start, bisect.bisect_left(sorted_tokens, prefix + LAST_CHARACTER, start)
+
+    def _postings_with_prefix(self, prefix: str) -> Iterator[tuple[str, set[int]]]:
+        start, end = self._prefix_range(prefix)
+        all_postings = self._postings
+        # In chunks, so a prefix matching most tokens doesn't copy all of them when the scan stops early.
+        for chunk_start in range(start, end, self.PREFIX_CHUNK_SIZE):
+            chunk_end = min(end, chunk_start + self.PREFIX_CHUNK_SIZE)
+            for token in self._sorted_tokens[chunk_start:chunk_end]:
+                postings = all_postings.get(token)
+                if postings is not None:
+                    yield token, postings
+
+    def _prefix_count(self, prefix: str) -> int:
+        """Roughly how many entities have a token starting with `prefix`, counted exactly up to `MAX_SCANNED`.
+
+        Past that the number of tokens stands in for the number of postings, which it never exceeds but for tokens
+        no longer in use, so the count stays cheap for prefixes that match most of the index.
+        """
+        start, end = self._prefix_range(prefix)
+        if end - start > self.MAX_SCANNED:
+            return end - start
+        count = 0
+        for _, postings in self._postings_with_prefix(prefix):
+            count += len(postings)
+            if count > self.MAX_SCANNED:
+                break
+        return count
+
+    @staticmethod
+    def _score(entity_tokens: frozenset[str], entity_text: str, query_tokens: list[tuple[str, str]]) -> int | None:
+        """Two points for each token that is one of the entity's, one for a prefix of one; None if any is neither.
+
+        Prefixes are looked up in `entity_text`, the entity's tokens each preceded by a space, as a single substring
+        search is much cheaper than comparing every token.
+        """
+        score = 0
+        for query_token, spaced_query_token in query_tokens:
+            if query_token in entity_tokens:
+                score += 2
+            elif spaced_query_token in entity_text:
+                score += 1
+            else:
+                return None
+        return score
+
+    def _add(self, entity: Entity, new_tokens: list[str]) -> int:
+        entity_id = next(self._ids)
+        texts = (entity.name, *entity.aliases)
+        tokens = frozenset(itertools.chain.from_iterable(tokenize(text) + camel_case_words(text) for text in texts))
+        self._entities[entity_id] = entity
+        self._entity_tokens[entity_id] = tokens
+        self._entity_texts[entity_id] = "".join(f" {token}" for token in tokens)
+        for token in tokens:
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = set()
+                if token in self._listed_tokens:
+                    self._unused_tokens -= 1
+                else:
+                    self._listed_tokens.add(token)
+                    new_tokens.append(token)
+            postings.add(entity_id)
+        return entity_id
+
+    def _remove(self, entity_id: int) -> None:
+        del self._entities[entity_id]
+        del self._entity_texts[entity_id]
+        for token in self._entity_tokens.pop(entity_id):
+            postings = self._postings[token]
+            postings.discard(entity_id)
+            if not postings:
+                del self._postings[token]
+                self._unused_tokens += 1
+
+    def _list_tokens(self, new_tokens: list[str]) -> None:
+        if len(new_tokens) <= self.MAX_INSORTED_TOKENS:
+            for token in new_tokens:
+                bisect.insort(self._sorted_tokens, token)
+        else:
+            # Two sorted runs, which the sort merges in linear time.
+            self._sorted_tokens.extend(sorted(new_tokens))
+            self._sorted_tokens.sort()
+        if self._unused_tokens * 2 > len(self._sorted_tokens):
+            self._sorted_tokens = [token for token in self._sorted_tokens if token in self._postings]
+            self._listed_tokens = set(self._sorted_tokens)
+            self._unused_tokens = 0
+
+
+entity_index = EntityIndex()
@@ -0,0 +1,11 @@
+import os
+
+
+def current_rss_bytes() -> int | None:
+    """Resident set size of this process, or None where `/proc` isn't available."""
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
@@ -0,0 +1,106 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures import as_completed
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from ..models import ServicePath
+from .aws_errors import is_auth_error
+from .client_pool import client_pool
+from .disk_cache import DiskCache
+
+if TYPE_CHECKING:
+    from botocore.config import Config
+
+
+@dataclass
+class ProfileIdentity:
+    profile_name: str
+    valid: bool
+    identity: dict[str, Any] = field(default_factory=dict)
+    # False when the check failed for reasons other than the credentials, e.g. a timeout, so validity is unknown.
+    verified: bool = True
+
+
+class ProfileVerifier:
+    """Verifies profiles with `sts.get_caller_identity` on a bounded thread pool and caches results on disk.
+
+    Only rejected or missing credentials make a profile invalid; results of failures that say nothing about the
+    credentials, like timeouts and connection errors, are reported as unverified and not cached.
+    """
+
+    MAX_WORKERS = 8
+    TIMEOUT_SECONDS = 5
+    # For all profiles together; profiles still unanswered by then are reported as unverified.
+    DEADLINE_SECONDS = 30
+    VALID_TTL = 60 * 60
+    INVALID_TTL = 5 * 60
+
+    def __init__(self, cache: DiskCache | None = None) -> None:
+        self._cache = cache or DiskCache("profile-identities")
+        self._sts_config: "Config | None" = None
+        self._sts_config_lock = threading.Lock()
+
+    def cached(self, profile_name: str) -> ProfileIdentity | None:
+        cached = self._cache.get(profile_name)
+        if cached is None:
+            return None
+        return ProfileIdentity(profile_name, cached.get("valid", False), cached.get("identity", {}))
+
+    def verify(
+        self,
+        profile_names: Iterable[str],
+        on_result: Callable[[ProfileIdentity], None],
+        is_cancelled: Callable[[], bool] = lambda: False,
+        deadline_seconds: float = DEADLINE_SECONDS,
+    ) -> None:
+        config = self.sts_config
+        executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS, thread_name_prefix="verify-profile")
+        futures = {
+            executor.submit(self.verify_profile, profile_name, config): profile_name for profile_name in profile_names
+        }
+        pending = dict(futures)
+        try:
+            for future in as_completed(futures, timeout=deadline_seconds):
+                if is_cancelled():
+                    return
+                del pending[future]
+                on_result(future.result())
+        except FuturesTimeoutError:
+            for profile_name in pending.values():
+                if is_cancelled():
+                    return
+                on_result(ProfileIdentity(profile_name, valid=False, verified=False))
+        finally:
+            # Calls still waiting on the network are left to finish on their own rather than holding up the caller.
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._cache.save()
+
+    @property
+    def sts_config(self) -> "Config":
+        """Created on first use, so botocore isn't imported until a profile is verified."""
+        with self._sts_config_lock:
+            if self._sts_config is None:
+                from botocore.config import Config
+
+                self._sts_config = Config(
+                    connect_timeout=self.TIMEOUT_SECONDS, read_timeout=self.TIMEOUT_SECONDS, retries={"max_attempts": 1}
+                )
+            return self._sts_config
+
+    def verify_profile(self, profile_name: str, config: "Config | None" = None) -> ProfileIdentity:
+        service_path = ServicePath(profile_name=profile_name, service_name="sts")
+        try:
+            response = client_pool.client(service_path, config=config or self.sts_config).get_caller_identity()
+        except Exception as error:
+            if not is_auth_error(error):
+                # Timeouts, unreachable endpoints and throttling say nothing about the profile, so it isn't cached.
+                return ProfileIdentity(profile_name, valid=False, verified=False)
+            result = ProfileIdentity(profile_name, valid=False)
+        else:
+            response.pop("ResponseMetadata", None)
+            result = ProfileIdentity(profile_name, valid=True, identity=response)
+        ttl = self.VALID_TTL if result.valid else self.INVALID_TTL
+        self._cache.set(profile_name, {"valid": result.valid, "identity": result.identity}, ttl)
+        return result
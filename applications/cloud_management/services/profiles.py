@@ -0,0 +1,31 @@
+import configparser
+import os
+
+
+def _read_config_file(path: str) -> configparser.RawConfigParser:
+    parser = configparser.RawConfigParser(default_section="__botocore_has_no_default_section__")
+    try:
+        parser.read(os.path.expanduser(path))
+    except (configparser.Error, UnicodeDecodeError):
+        pass
+    return parser
+
+
+def read_available_profiles() -> list[str]:
+    """List profile names the way botocore does, without importing it.
+
+    Profiles come from `default` and `profile <name>` sections of the config file, followed by every section of the
+    shared credentials file.
+    """
+    profiles: dict[str, None] = {}
+    config = _read_config_file(os.environ.get("AWS_CONFIG_FILE", "~/.aws/config"))
+    for section in config.sections():
+        parts = section.split()
+        if section == "default":
+            profiles["default"] = None
+        elif len(parts) == 2 and parts[0] == "profile":
+            profiles[parts[1]] = None
+    credentials = _read_config_file(os.environ.get("AWS_SHARED_CREDENTIALS_FILE", "~/.aws/credentials"))
+    for section in credentials.sections():
+        profiles[section] = None
+    return list(profiles)
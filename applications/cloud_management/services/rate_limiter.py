@@ -0,0 +1,180 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator
+
+from ..models import ServicePath
+
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+
+RateLimiterKey = tuple[str | None, str | None, str | None]
+
+THROTTLING_ERROR_CODES = {
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottledException",
+    "TooManyRequestsException",
+    "ProvisionedThroughputExceededException",
+    "TransactionInProgressException",
+    "RequestLimitExceeded",
+    "BandwidthLimitExceeded",
+    "LimitExceededException",
+    "RequestThrottled",
+    "SlowDown",
+    "PriorRequestNotComplete",
+    "EC2ThrottledException",
+}
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    response = getattr(error, "response", None) or {}
+    return response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+
+
+class TokenBucket:
+    """Token bucket whose refill rate halves on every throttle and creeps back up on every success.
+
+    Background requests only take a token when no foreground request is waiting for one.
+    """
+
+    MIN_RATE = 0.5
+    RATE_INCREASE = 0.5
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._condition = threading.Condition()
+        self._foreground_waiting = 0
+        self.requests = 0
+        self.throttles = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    def acquire(self, background: bool = False) -> None:
+        started_at = time.monotonic()
+        with self._condition:
+            if not background:
+                self._foreground_waiting += 1
+            try:
+                while True:
+                    self._refill()
+                    if self._tokens >= 1 and not (background and self._foreground_waiting):
+                        self._tokens -= 1
+                        break
+                    self._condition.wait(max(0.01, (1 - self._tokens) / self.rate))
+            finally:
+                if not background:
+                    self._foreground_waiting -= 1
+                    self._condition.notify_all()
+            self.requests += 1
+            waited = time.monotonic() - started_at
+            if waited > 0.001:
+                self.waits += 1
+                self.wait_seconds += waited
+
+    def throttled(self) -> None:
+        with self._condition:
+            self._refill()
+            self.throttles += 1
+            self.rate = max(self.MIN_RATE, self.rate / 2)
+            self._tokens = min(self._tokens, 0)
+
+    def succeeded(self) -> None:
+        with self._condition:
+            if self.rate < self.max_rate:
+                self._refill()
+                self.rate = min(self.max_rate, self.rate + self.RATE_INCREASE)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        with self._condition:
+            return {
+                "rate": self.rate,
+                "requests": self.requests,
+                "throttles": self.throttles,
+                "waits": self.waits,
+                "wait_seconds": self.wait_seconds,
+            }
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+
+class RateLimiter:
+    """Client-side rate limit shared by every client of the same (profile, region, service).
+
+    Clients are attached through botocore events: a token is taken before each call, and throttling errors seen by
+    the retry handler slow the bucket down. Calls made inside `background()` yield to foreground calls.
+    """
+
+    DEFAULT_RATE = 10.0
+    DEFAULT_BURST = 10.0
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: float = DEFAULT_BURST) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._lock = threading.Lock()
+        self._buckets: dict[RateLimiterKey, TokenBucket] = {}
+        self._local = threading.local()
+
+    def bucket(self, service_path: ServicePath) -> TokenBucket:
+        key = (service_path.profile_name, service_path.region_name, service_path.service_name)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self._rate, self._burst)
+            return bucket
+
+    def attach(self, client: "BaseClient", service_path: ServicePath) -> None:
+        bucket = self.bucket(service_path)
+
+        def before_call(**kwargs) -> None:
+            bucket.acquire(background=self.in_background)
+
+        def needs_retry(response: tuple[Any, dict[str, Any]] | None = None, **kwargs) -> None:
+            if response is not None and response[1].get("Error", {}).get("Code") in THROTTLING_ERROR_CODES:
+                bucket.throttled()
+
+        def after_call(parsed: dict[str, Any], **kwargs) -> None:
+            if "Error" not in parsed:
+                bucket.succeeded()
+
+        client.meta.events.register("before-call", before_call)
+        client.meta.events.register("needs-retry", needs_retry)
+        client.meta.events.register("after-call", after_call)
+
+    @property
+    def in_background(self) -> bool:
+        return getattr(self._local, "background", False)
+
+    @contextmanager
+    def background(self) -> Iterator[None]:
+        """Mark the calls made by the current thread as background refreshes."""
+        previous = self.in_background
+        self._local.background = True
+        try:
+            yield
+        finally:
+            self._local.background = previous
+
+    @property
+    def throttles(self) -> int:
+        with self._lock:
+            buckets = list(self._buckets.values())
+        return sum(bucket.throttles for bucket in buckets)
+
+    @property
+    def stats(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {"/".join(str(part) for part in key): bucket.stats for key, bucket in buckets.items()}
+
+
+rate_limiter = RateLimiter()
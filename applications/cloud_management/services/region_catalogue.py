@@ -0,0 +1,85 @@
+import re
+import threading
+from importlib.metadata import PackageNotFoundError, version
+
+from ..models import Region, SearchIndex
+from ..strings import AWS_REGION_MAP
+from .disk_cache import DiskCache
+
+DESCRIPTION_LOCATION = re.compile(r"\((?P<location>[^)]+)\)")
+
+
+class RegionCatalogue:
+    """The regions of the standard AWS partition, from botocore's endpoint data and named after `AWS_REGION_MAP`.
+
+    Discovered regions are cached on disk per botocore version, so the SDK isn't imported for them again until it is
+    upgraded. Regions in `AWS_REGION_MAP` come first, in its order and with its short names; any others the SDK
+    knows about follow, named after the location in their endpoint description.
+    """
+
+    PARTITION = "aws"
+    CACHE_TTL = 30 * 24 * 60 * 60
+
+    def __init__(self, cache: DiskCache | None = None) -> None:
+        self._cache = cache or DiskCache("regions")
+        self._lock = threading.Lock()
+        self._regions: list[Region] | None = None
+        self._search_index: SearchIndex[Region] | None = None
+
+    def regions(self) -> list[Region]:
+        with self._lock:
+            if self._regions is None:
+                self._regions = self._merge(self._discovered_regions())
+            return self._regions
+
+    def region_names(self) -> list[str]:
+        return [region.region_name for region in self.regions()]
+
+    def search_index(self) -> SearchIndex[Region]:
+        regions = self.regions()
+        with self._lock:
+            if self._search_index is None:
+                self._search_index = SearchIndex((region.title, region) for region in regions)
+            return self._search_index
+
+    def _discovered_regions(self) -> dict[str, str]:
+        cache_key = f"{self.PARTITION}:botocore-{self._sdk_version()}"
+        descriptions = self._cache.get(cache_key)
+        if descriptions is None:
+            try:
+                descriptions = self._load_descriptions()
+            except Exception:
+                # Without endpoint data the curated regions are still usable; they aren't cached so it's retried.
+                return {}
+            self._cache.set(cache_key, descriptions, self.CACHE_TTL)
+            self._cache.save()
+        return descriptions
+
+    def _load_descriptions(self) -> dict[str, str]:
+        from botocore.loaders import create_loader
+
+        endpoints = create_loader().load_data("endpoints")
+        for partition in endpoints.get("partitions", []):
+            if partition.get("partition") == self.PARTITION:
+                return {
+                    region_name: region.get("description", region_name)
+                    for region_name, region in partition.get("regions", {}).items()
+                }
+        return {}
+
+    def _merge(self, descriptions: dict[str, str]) -> list[Region]:
+        regions = [Region(region_name, data.get("name", region_name)) for region_name, data in AWS_REGION_MAP.items()]
+        for region_name in sorted(set(descriptions) - set(AWS_REGION_MAP)):
+            match = DESCRIPTION_LOCATION.search(descriptions[region_name])
+            regions.append(Region(region_name, match["location"] if match else descriptions[region_name]))
+        return regions
+
+    @staticmethod
+    def _sdk_version() -> str:
+        try:
+            return version("botocore")
+        except PackageNotFoundError:
+            return "unknown"
+
+
+region_catalogue = RegionCatalogue()
@@ -0,0 +1,60 @@
+import threading
+from concurrent.futures import CancelledError, Future
+from typing import Any, Callable, Hashable, TypeVar
+
+ResultType = TypeVar("ResultType")
+
+
+class SingleFlight:
+    """Collapses concurrent calls that share a key into a single call.
+
+    The first caller for a key runs the function; callers that arrive while it is still running wait for it and get
+    the same result, or the same exception. A function that raises `CancelledError` hands the call over to one of the
+    waiting callers instead. Once the call finishes the key is forgotten, so later calls run again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, function: Callable[[], ResultType]) -> ResultType:
+        while True:
+            with self._lock:
+                future = self._calls.get(key)
+                leader = future is None
+                if future is None:
+                    future = self._calls[key] = Future()
+                    self.calls += 1
+                else:
+                    self.shared += 1
+            if leader:
+                break
+            try:
+                return future.result()
+            except CancelledError:
+                # The caller that ran the function gave up half way, so one of the waiting callers runs it instead.
+                continue
+        try:
+            result = function()
+        except BaseException as error:
+            self._forget(key)
+            future.set_exception(error)
+            raise
+        self._forget(key)
+        future.set_result(result)
+        return result
+
+    def _forget(self, key: Hashable) -> None:
+        # Forgotten before the waiters wake up, so a waiter that takes over a cancelled call starts a new one.
+        with self._lock:
+            self._calls.pop(key, None)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"in_flight": len(self._calls), "calls": self.calls, "shared": self.shared}
+
+
+single_flight = SingleFlight()
@@ -0,0 +1,122 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, TextIO
+
+from ..models import ServicePath, StackSummary
+from ..strings import AWS_LISTED_STACK_STATUSES
+from .aws_errors import is_auth_error, is_region_not_enabled_error
+from .client_pool import client_pool
+from .stack_fan_out import StackFanOut
+
+
+class StackExporter:
+    """Writes the stacks of many profiles and regions, with their parameters, outputs and resources, as JSON lines.
+
+    Stacks are listed through `StackFanOut` and each one is exported on a second bounded pool. Listing waits while
+    too many stacks are queued, so memory use stays flat however many stacks there are. Profile/region pairs whose
+    credentials are rejected or whose region isn't enabled for the account are skipped rather than counted as errors,
+    so exporting every region of every profile doesn't fail on opt-in regions.
+    """
+
+    RECORD_TYPES = ("stack", "parameter", "output", "resource")
+    MAX_WORKERS = 8
+
+    def __init__(
+        self, output: TextIO, record_types: Iterable[str] = RECORD_TYPES, max_workers: int = MAX_WORKERS
+    ) -> None:
+        self._output = output
+        self._record_types = set(record_types)
+        self._max_workers = max_workers
+        self._fan_out = StackFanOut(max_workers=max_workers)
+        self._queued = threading.BoundedSemaphore(max_workers * 4)
+        self._write_lock = threading.Lock()
+        self.stacks = 0
+        self.records = 0
+        self.errors = 0
+        self.skipped = 0
+
+    def export(self, service_paths: Iterable[ServicePath]) -> None:
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="stack-export") as executor:
+
+            def on_stacks(service_path: ServicePath, stack_summaries: list[dict[str, Any]]) -> None:
+                for stack_summary in stack_summaries:
+                    self._queued.acquire()
+                    future = executor.submit(self.export_stack, service_path, StackSummary.from_response(stack_summary))
+                    future.add_done_callback(lambda _: self._queued.release())
+
+            def on_finished(service_path: ServicePath, error: BaseException | None) -> None:
+                if error is None:
+                    return
+                if is_auth_error(error) or is_region_not_enabled_error(error):
+                    self.write_skipped(service_path, error)
+                else:
+                    self.write_error(service_path, None, error)
+
+            self._fan_out.list_stacks(service_paths, AWS_LISTED_STACK_STATUSES, on_stacks, on_finished)
+        self._output.flush()
+
+    def export_stack(self, service_path: ServicePath, stack: StackSummary) -> None:
+        client = client_pool.client(service_path, config=self._fan_out.config)
+        base = self.base_record(service_path, stack)
+        try:
+            if self._record_types & {"stack", "parameter", "output"}:
+                for description in client.describe_stacks(StackName=stack.stack_id).get("Stacks", []):
+                    parameters = description.pop("Parameters", [])
+                    outputs = description.pop("Outputs", [])
+                    if "stack" in self._record_types:
+                        self.write({"type": "stack", **base, **description})
+                    if "parameter" in self._record_types:
+                        for parameter in parameters:
+                            self.write({"type": "parameter", **base, **parameter})
+                    if "output" in self._record_types:
+                        for output in outputs:
+                            self.write({"type": "output", **base, **output})
+            if "resource" in self._record_types:
+                paginator = client.get_paginator("list_stack_resources")
+                for page in paginator.paginate(StackName=stack.stack_id):
+                    for resource in page.get("StackResourceSummaries", []):
+                        self.write({"type": "resource", **base, **resource})
+        except Exception as error:
+            self.write_error(service_path, stack, error)
+            return
+        with self._write_lock:
+            self.stacks += 1
+
+    @staticmethod
+    def base_record(service_path: ServicePath, stack: StackSummary) -> dict[str, Any]:
+        stack_id = stack.stack_id or ""
+        return {
+            "profile": service_path.profile_name,
+            "region": service_path.region_name,
+            "account": stack_id.split(":")[4] if stack_id.count(":") >= 5 else None,
+            "stack_id": stack.stack_id,
+            "stack_name": stack.stack_name,
+        }
+
+    def write_error(self, service_path: ServicePath, stack: StackSummary | None, error: BaseException) -> None:
+        record = {"type": "error", "profile": service_path.profile_name, "region": service_path.region_name}
+        if stack is not None:
+            record.update(stack_id=stack.stack_id, stack_name=stack.stack_name)
+        self.write({**record, "error": str(error)})
+        with self._write_lock:
+            self.errors += 1
+
+    def write_skipped(self, service_path: ServicePath, error: BaseException) -> None:
+        self.write(
+            {
+                "type": "skipped",
+                "profile": service_path.profile_name,
+                "region": service_path.region_name,
+                "error": str(error),
+            }
+        )
+        with self._write_lock:
+            self.skipped += 1
+
+    def write(self, record: dict[str, Any]) -> None:
+        record.pop("ResponseMetadata", None)
+        line = json.dumps(record, default=str)
+        with self._write_lock:
+            self._output.write(line + "\n")
+            self.records += 1
@@ -0,0 +1,76 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from ..models import ServicePath
+from .client_pool import client_pool
+
+if TYPE_CHECKING:
+    from botocore.config import Config
+
+
+class StackFanOut:
+    """Lists the stacks of many (profile, region) pairs at once on a bounded thread pool.
+
+    Every page is handed to `on_stacks` as soon as it arrives, so a slow or failing region never holds back the
+    others; `on_finished` is called once per pair with the error that stopped it, if any.
+    """
+
+    MAX_WORKERS = 8
+    TIMEOUT_SECONDS = 10
+
+    def __init__(self, max_workers: int = MAX_WORKERS) -> None:
+        self._max_workers = max_workers
+        self._config: "Config | None" = None
+        self._config_lock = threading.Lock()
+
+    @property
+    def config(self) -> "Config":
+        """Created on first use, so botocore isn't imported until stacks are listed."""
+        with self._config_lock:
+            if self._config is None:
+                from botocore.config import Config
+
+                self._config = Config(
+                    connect_timeout=self.TIMEOUT_SECONDS, read_timeout=self.TIMEOUT_SECONDS, retries={"max_attempts": 2}
+                )
+            return self._config
+
+    def list_stacks(
+        self,
+        service_paths: Iterable[ServicePath],
+        stack_status_filter: list[str],
+        on_stacks: Callable[[ServicePath, list[dict[str, Any]]], None],
+        on_finished: Callable[[ServicePath, BaseException | None], None],
+        is_cancelled: Callable[[], bool] = lambda: False,
+    ) -> None:
+        config = self.config
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="stack-fan-out") as executor:
+            futures = {
+                executor.submit(
+                    self._list_stacks, service_path, config, stack_status_filter, on_stacks, is_cancelled
+                ): service_path
+                for service_path in service_paths
+            }
+            try:
+                for future in as_completed(futures):
+                    if is_cancelled():
+                        break
+                    on_finished(futures[future], future.exception())
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def _list_stacks(
+        self,
+        service_path: ServicePath,
+        config: "Config",
+        stack_status_filter: list[str],
+        on_stacks: Callable[[ServicePath, list[dict[str, Any]]], None],
+        is_cancelled: Callable[[], bool],
+    ) -> None:
+        client = client_pool.client(service_path, config=config)
+        for page in client.get_paginator("list_stacks").paginate(StackStatusFilter=stack_status_filter):
+            if is_cancelled():
+                return
+            on_stacks(service_path, page.get("StackSummaries", []))
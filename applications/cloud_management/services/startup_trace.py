@@ -0,0 +1,30 @@
+import time
+
+
+class StartupTrace:
+    """Records named startup milestones and reports the time spent in each phase."""
+
+    def __init__(self, started_at: float | None = None) -> None:
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self._marks: list[tuple[str, float]] = []
+
+    def mark(self, name: str) -> None:
+        if all(mark_name != name for mark_name, _ in self._marks):
+            self._marks.append((name, time.perf_counter()))
+
+    def elapsed(self, name: str) -> float | None:
+        """Seconds from the start of the trace to the mark called `name`, if it has been reached."""
+        for mark_name, timestamp in self._marks:
+            if mark_name == name:
+                return timestamp - self.started_at
+        return None
+
+    def report(self) -> str:
+        lines = ["Startup trace:"]
+        previous = self.started_at
+        for name, timestamp in self._marks:
+            phase_ms = (timestamp - previous) * 1000
+            elapsed_ms = (timestamp - self.started_at) * 1000
+            lines.append(f"  {name:<16}{phase_ms:9.1f} ms  (at {elapsed_ms:.1f} ms)")
+            previous = timestamp
+        return "\n".join(lines)
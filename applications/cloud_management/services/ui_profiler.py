@@ -0,0 +1,189 @@
+import functools
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Generator
+
+FRAME_SECONDS = 1 / 60
+
+
+@dataclass
+class ProfileEntry:
+    name: str
+    kind: str
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    slow_calls: int = 0
+
+    def add(self, seconds: float, slow: bool) -> None:
+        self.calls += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.slow_calls += slow
+
+
+class BlockingTimer:
+    """Wraps an awaitable to time the longest step it runs on the event loop between two suspensions."""
+
+    def __init__(self, awaitable: Awaitable) -> None:
+        self._awaitable = awaitable
+        self.max_step_seconds = 0.0
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        iterator = self._awaitable.__await__()
+        step, value = iterator.send, None
+        while True:
+            started_at = time.perf_counter()
+            try:
+                signal = step(value)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self.max_step_seconds = max(self.max_step_seconds, time.perf_counter() - started_at)
+            try:
+                value = yield signal
+            except GeneratorExit:
+                iterator.close()
+                raise
+            except BaseException as error:
+                step, value = iterator.throw, error
+            else:
+                step = iterator.send
+
+
+class UIProfiler:
+    """Times message handlers, compose, renders and workers by patching Textual while installed.
+
+    Nothing is patched until `install` is called, so the app pays nothing for the profiler unless it is enabled.
+    Times are inclusive: a handler that triggers a render is charged for it too, and async handlers and workers are
+    charged for the time they spend awaiting. A call is only counted as slow when it holds up the event loop for
+    longer than a frame in one go, i.e. between two awaits, since time spent suspended doesn't delay anything else.
+    """
+
+    def __init__(self, frame_seconds: float = FRAME_SECONDS) -> None:
+        self._frame_seconds = frame_seconds
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str], ProfileEntry] = {}
+        self._patches: list[tuple[Any, str, Any]] = []
+
+    @property
+    def installed(self) -> bool:
+        return bool(self._patches)
+
+    def install(self) -> None:
+        if self.installed:
+            return
+        from textual import app as app_module
+        from textual import widget as widget_module
+        from textual.message_pump import MessagePump
+        from textual.widget import Widget
+        from textual.worker import Worker
+
+        profiler = self
+
+        original_dispatch = MessagePump._dispatch_message
+
+        @functools.wraps(original_dispatch)
+        async def _dispatch_message(self, message) -> None:
+            started_at = time.perf_counter()
+            timer = BlockingTimer(original_dispatch(self, message))
+            try:
+                await timer
+            finally:
+                profiler.record(
+                    "handler",
+                    f"{type(self).__name__}.{message.handler_name}",
+                    started_at,
+                    blocking_seconds=timer.max_step_seconds,
+                )
+
+        original_render_lines = Widget.render_lines
+
+        @functools.wraps(original_render_lines)
+        def render_lines(self, crop):
+            started_at = time.perf_counter()
+            try:
+                return original_render_lines(self, crop)
+            finally:
+                profiler.record("render", f"{type(self).__name__}.render", started_at)
+
+        original_compose = widget_module.compose
+
+        @functools.wraps(original_compose)
+        def compose(node):
+            started_at = time.perf_counter()
+            try:
+                return original_compose(node)
+            finally:
+                profiler.record("compose", f"{type(node).__name__}.compose", started_at)
+
+        original_run = Worker._run
+
+        @functools.wraps(original_run)
+        async def _run(self, app) -> None:
+            started_at = time.perf_counter()
+            timer = BlockingTimer(original_run(self, app))
+            try:
+                await timer
+            finally:
+                # Thread workers run off the event loop, so only async workers can hold up a frame.
+                kind = "thread worker" if self._thread_worker else "worker"
+                profiler.record(
+                    kind,
+                    f"{type(self.node).__name__}.{self.name or self.group}",
+                    started_at,
+                    flag_slow=not self._thread_worker,
+                    blocking_seconds=timer.max_step_seconds,
+                )
+
+        self._patch(MessagePump, "_dispatch_message", _dispatch_message)
+        self._patch(Widget, "render_lines", render_lines)
+        # App and Widget both call the `compose` helper they imported, so it is replaced in both modules.
+        self._patch(widget_module, "compose", compose)
+        self._patch(app_module, "compose", compose)
+        self._patch(Worker, "_run", _run)
+
+    def uninstall(self) -> None:
+        while self._patches:
+            target, attribute, original = self._patches.pop()
+            setattr(target, attribute, original)
+
+    def _patch(self, target: Any, attribute: str, replacement: Callable) -> None:
+        self._patches.append((target, attribute, getattr(target, attribute)))
+        setattr(target, attribute, replacement)
+
+    def record(
+        self, kind: str, name: str, started_at: float, flag_slow: bool = True, blocking_seconds: float | None = None
+    ) -> None:
+        """Add a call that started at `started_at` and has just finished.
+
+        `blocking_seconds` is the longest the call held up the event loop in one go, for calls that awaited; it
+        defaults to the whole duration.
+        """
+        seconds = time.perf_counter() - started_at
+        if blocking_seconds is None:
+            blocking_seconds = seconds
+        with self._lock:
+            entry = self._entries.get((kind, name))
+            if entry is None:
+                entry = self._entries[(kind, name)] = ProfileEntry(name, kind)
+            entry.add(seconds, flag_slow and blocking_seconds > self._frame_seconds)
+
+    def entries(self) -> list[ProfileEntry]:
+        """Profiled calls, most expensive first."""
+        with self._lock:
+            return sorted(self._entries.values(), key=lambda entry: -entry.total_seconds)
+
+    def report(self, limit: int | None = None) -> str:
+        lines = [
+            f"UI profile ({self._frame_seconds * 1000:.1f} ms frame):",
+            f"  {'kind':<14}{'name':<56}{'calls':>8}{'total ms':>11}{'avg ms':>9}{'max ms':>9}{'slow':>6}",
+        ]
+        for entry in self.entries()[:limit]:
+            lines.append(
+                f"  {entry.kind:<14}{entry.name[:55]:<56}{entry.calls:>8}{entry.total_seconds * 1000:>11.1f}"
+                f"{entry.total_seconds / entry.calls * 1000:>9.2f}{entry.max_seconds * 1000:>9.1f}"
+                f"{entry.slow_calls:>6}"
+            )
+        return "\n".join(lines)
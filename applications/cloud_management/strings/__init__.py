@@ -1,4 +1,5 @@
 from .regions import AWS_REGION_MAP
 from .services import AWS_SERVICE_MAP
+from .stack_statuses import AWS_LISTED_STACK_STATUSES, AWS_STACK_STATUSES
 
-__all__ = ["AWS_REGION_MAP", "AWS_SERVICE_MAP"]
+__all__ = ["AWS_LISTED_STACK_STATUSES", "AWS_REGION_MAP", "AWS_SERVICE_MAP", "AWS_STACK_STATUSES"]